@@ -5,7 +5,7 @@ import init
 
 from src import *
 import os
-import math
+import numpy as np
 
 if __name__ == "__main__":
     sats = init_sats()
@@ -15,32 +15,26 @@ if __name__ == "__main__":
     unix_timestamp = int(t.utc_datetime().timestamp())  # type: ignore
 
     # generate path
-    dir = "./data/csv/"
+    dir = os.path.join(".", "data", "csv")
     file = f"ITRS{unix_timestamp}.csv"
-    filepath = dir + file
+    filepath = os.path.join(dir, file)
 
-    if not os.path.exists(dir):
-        os.makedirs(dir)
+    os.makedirs(dir, exist_ok=True)
 
-    with open(filepath, "w") as f:
-        f.write(
-            "name,launch_date,x[km],y[km],z[km],x_v[km/s],y_v[km/s],z_v[km/s]\n")
+    # propogate all sats at once
+    data = sats.ITRS_cartesian_positions_and_velocities_at(t)
 
-        for sat in sats.sats:
-            x, y, z, x_v, y_v, z_v = sat.ITRS_cartesian_position_and_velocity_at(
-                t)
+    # remove invalid projection from data
+    valid = np.isfinite(data).all(axis=1)
 
-            # remove invalid projection from data
-            valid = True
-            for item in [x, y, z, x_v, y_v, z_v]:
-                if math.isnan(item):
-                    valid = False
-                    break
-            if not valid:
-                continue
+    # build name and launch date columns for valid sats
+    valid_sats = np.array(sats.sats, dtype=object)[valid]
+    names = [sat.name for sat in valid_sats]
+    launch_dates = [str(sat.launch_date.date()) if sat.launch_date else ""
+                    for sat in valid_sats]
 
-            launch_date = str(sat.launch_date.date()
-                              ) if sat.launch_date else ""
-
-            f.write(
-                f"{sat.name},{launch_date},{x},{y},{z},{x_v},{y_v},{z_v}\n")
+    # write all rows in one buffered call
+    with open(filepath, "wb", buffering=1 << 20) as f:
+        np.savetxt(f, np.column_stack((names, launch_dates, data[valid].astype(object))),
+                   fmt=["%s", "%s"] + ["%.6f"] * 6, delimiter=",", comments="", encoding="utf-8",
+                   header="name,launch_date,x[km],y[km],z[km],x_v[km/s],y_v[km/s],z_v[km/s]")
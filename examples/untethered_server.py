@@ -3,7 +3,10 @@ import init
 
 from src import *
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from skyfield.constants import DAY_S
+import numpy as np
 import time
 import datetime
 
@@ -81,25 +84,30 @@ timer = LapTimer()
 
 # convert datetime to skyfield time scale
 t_start = ts.from_datetime(dt_start)
-t_end = ts.from_datetime(dt_end)
-t = t_start
+times = t_start + np.arange(0, (dt_end - dt_start).total_seconds()) / DAY_S
 
+# views of each frame are rendered and saved in parallel while the next frame is propogated
+pending = []
 try:
-    while t < t_end:
-        # propogate sat positions
-        sat_frame = model.generate_sat_frame(t)
-
-        # generate image frame for each modifier and save
-        for idx, modifer in enumerate(modifiers):
-            path = f"{SRC_DIR}/{width}x{height}/{idx}/{sat_frame.unix_timestamp_seconds}.png"
-            frame = sat_frame.render(modifer)
-            frame.to_png(path)
-
-        # increment propogation time
-        t += datetime.timedelta(seconds=1)
-
-        timer.lap()
-        print(timer.info() + " "*20, end="\r")
+    with ThreadPoolExecutor(max_workers=len(modifiers)) as executor:
+        # propogate sat positions for every second at once
+        for sat_frame in model.generate_sat_frames(times):
+            # wait for the previous frame to be saved, raising any errors
+            for future in pending:
+                future.result()
+
+            # generate image frame for each modifier and save
+            pending = [
+                executor.submit(render_and_save_png, sat_frame, modifer,
+                                f"{SRC_DIR}/{width}x{height}/{idx}/{sat_frame.unix_timestamp_seconds}.png")
+                for idx, modifer in enumerate(modifiers)
+            ]
+
+            timer.lap()
+            print(timer.info() + " "*20, end="\r")
+
+        for future in pending:
+            future.result()
 except KeyboardInterrupt:
     print("\nProccess stopped")
 
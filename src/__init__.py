@@ -7,6 +7,5 @@ from .matrix import Matrix, ImageFrame
 from .rgb import RGB
 from .analysis import AlwaysPixelModifier, LaunchDateModifier, TagPixelModifier, NotTagPixelMofidier, AltitudeModifier, DistanceModifier
 from .device import *
-# from .deviceinterface import DeviceInterface
 from .projectionmodels import TopocentricProjectionModel, GeocentricProjectionModel
-from .utility import dirname, get_estimated_latlon, LapTimer, create_backup_images, factory_reset_device, reset_device
+from .utility import dirname, get_estimated_latlon, LapTimer, GifWriter, render_and_save_png, create_backup_images, factory_reset_device, reset_device
@@ -1,13 +1,43 @@
 """contains code for analysing propogation data"""
 from .rgb import RGB
-from .models import Sat, SatPosition
+from .models import Sat, SatPosition, datetime_to_us
 from datetime import datetime
-from typing import Any
+from typing import Any, TYPE_CHECKING
+
+import warnings
+
+import numpy as np
+if TYPE_CHECKING:
+    from .projectionmodels import SatFrame
 
 
 class BasePixelModifier:
     """base class for modifiers that change rgb values based on Sat tags or otherwise
     """
+    _uses_mask = False
+    """whether `mask` is used instead of calling `handle` for each sat, set automatically for subclasses"""
+
+    def __init__(self, modifier: RGB) -> None:
+        self.modifier = modifier
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        # only use mask if it is defined alongside or after handle, so subclasses that only change handle still work
+        mro = cls.__mro__
+        mask_cls = next(c for c in mro if "mask" in c.__dict__)
+        handle_cls = next(c for c in mro if "handle" in c.__dict__)
+        cls._uses_mask = mask_cls is not BasePixelModifier and mro.index(
+            mask_cls) <= mro.index(handle_cls)
+
+    @property
+    def modifier(self) -> RGB:
+        return self._modifier
+
+    @modifier.setter
+    def modifier(self, modifier: RGB) -> None:
+        self._modifier = modifier
+        # precomputed for the vectorised renderer
+        self._rgb_vec = np.array(modifier.to_tuple(), dtype=np.int16)
 
     def handle(self, sat: SatPosition, rgb: RGB) -> RGB:
         """handle the modifier, check if the sat fits the criterium and return the new rgb values as appropriately
@@ -21,6 +51,19 @@ class BasePixelModifier:
         """
         raise NotImplementedError
 
+    def mask(self, frame: "SatFrame") -> np.ndarray | None:
+        """vectorised version of the criterium in `handle` for every sat in a frame at once
+
+        modifiers that support this are applied by adding their modifier to every pixel of a sat in the mask, without calling `handle` per sat
+
+        Args:
+            frame: SatFrame containing the sats to check
+
+        Returns:
+            boolean mask with an element per sat in the frame, or None if not supported by this modifier
+        """
+        return None
+
     def info(self) -> str:
         raise NotImplementedError()
 
@@ -30,11 +73,14 @@ class AlwaysPixelModifier(BasePixelModifier):
 
     def __init__(self, modifier: RGB) -> None:
         """create a new pixel modifier that will always change the colour of the pixel by adding the modifier to the current pixel if any of the tags match the sat"""
-        self.modifier = modifier
+        super().__init__(modifier)
 
     def handle(self, sat: SatPosition, rgb: RGB) -> RGB:
         return rgb + self.modifier
 
+    def mask(self, frame: "SatFrame") -> np.ndarray | None:
+        return np.ones(frame.number_of_sats, dtype=bool)
+
     def info(self) -> str:
         return f"{self.modifier.info()} always"
 
@@ -54,13 +100,26 @@ class TagPixelModifier(BasePixelModifier):
             self.tags = [tags.lower()]
         else:
             self.tags = [tag.lower() for tag in tags]
-        self.modifer = modifer
+        self._tag_set = frozenset(self.tags)
+        super().__init__(modifer)
+
+    @property
+    def modifer(self) -> RGB:
+        """alias of `modifier`, kept for backwards compatibility"""
+        return self.modifier
+
+    @modifer.setter
+    def modifer(self, modifer: RGB) -> None:
+        self.modifier = modifer
 
     def handle(self, sat: SatPosition, rgb: RGB) -> RGB:
-        if any(tag in sat.sat.tags for tag in self.tags):
+        if not self._tag_set.isdisjoint(sat.sat.tags):
             rgb += self.modifer
         return rgb
 
+    def mask(self, frame: "SatFrame") -> np.ndarray | None:
+        return frame.tag_mask(self.tags)
+
     def info(self) -> str:
         return f"{self.modifer} if includes one of following tags: {', '.join(self.tags)}"
 
@@ -78,10 +137,13 @@ class NotTagPixelMofidier(TagPixelModifier):
         super().__init__(tags, modifer)
 
     def handle(self, sat: SatPosition, rgb: RGB) -> RGB:
-        if not any(tag in sat.sat.tags for tag in self.tags):
+        if self._tag_set.isdisjoint(sat.sat.tags):
             rgb += self.modifer
         return rgb
 
+    def mask(self, frame: "SatFrame") -> np.ndarray | None:
+        return ~frame.tag_mask(self.tags)
+
     def info(self) -> str:
         return f"{self.modifer} if doesn't include any of following tags: {', '.join(self.tags)}"
 
@@ -99,15 +161,42 @@ class LaunchDateModifier(BasePixelModifier):
         """
         self.min_datetime = min_datetime
         self.max_datetime = max_datetime
-        self.modifier = modifier
+        super().__init__(modifier)
+
+    @property
+    def min_datetime(self) -> datetime:
+        return self._min_datetime
+
+    @min_datetime.setter
+    def min_datetime(self, min_datetime: datetime) -> None:
+        self._min_datetime = min_datetime
+        # precomputed for the vectorised renderer and as ints for handle
+        self._min_datetime64 = np.datetime64(min_datetime)
+        self._min_us = datetime_to_us(min_datetime)
+
+    @property
+    def max_datetime(self) -> datetime:
+        return self._max_datetime
+
+    @max_datetime.setter
+    def max_datetime(self, max_datetime: datetime) -> None:
+        self._max_datetime = max_datetime
+        self._max_datetime64 = np.datetime64(max_datetime)
+        self._max_us = datetime_to_us(max_datetime)
 
     def handle(self, sat: SatPosition, rgb: RGB) -> RGB:
-        if not sat.sat.launch_date:
+        launch_us = sat.sat._launch_us
+        if launch_us is None:
             return rgb
-        if self.min_datetime < sat.sat.launch_date and self.max_datetime > sat.sat.launch_date:
+        if self._min_us < launch_us < self._max_us:
             rgb += self.modifier
         return rgb
 
+    def mask(self, frame: "SatFrame") -> np.ndarray | None:
+        # unknown launch dates are NaT which never compare as True
+        launch_dates = frame.model._sats.launch_dates[frame.indices]
+        return (self._min_datetime64 < launch_dates) & (self._max_datetime64 > launch_dates)
+
     def info(self) -> str:
         return f"{self.modifier.info()} if launch date is between {self.min_datetime.date().isoformat()} and {self.max_datetime.date().isoformat()}"
 
@@ -123,17 +212,25 @@ class AltitudeModifier(BasePixelModifier):
         """
         self.min_alt = min_alt
         self.max_alt = max_alt
-        self.modifier = modifier
+        super().__init__(modifier)
 
     def handle(self, sat: SatPosition, rgb: RGB) -> RGB:
         if sat.altitude == -1:
-            raise Warning(
+            warnings.warn(
                 "No altitude specified with sat, orbit altitude modifier is not support for this reference frame")
             return rgb
         if self.min_alt < sat.altitude and self.max_alt > sat.altitude:
             rgb += self.modifier
         return rgb
 
+    def mask(self, frame: "SatFrame") -> np.ndarray | None:
+        altitude = frame.altitude_km
+        known = altitude != -1
+        if not known.all():
+            warnings.warn(
+                "No altitude specified with sat, orbit altitude modifier is not support for this reference frame")
+        return known & (self.min_alt < altitude) & (self.max_alt > altitude)
+
     def info(self) -> str:
         return f"{self.modifier.info()} if altitude is between {self.min_alt}km and {self.max_alt}km"
 
@@ -149,16 +246,24 @@ class DistanceModifier(BasePixelModifier):
         """
         self.min_distance = min_distance
         self.max_distance = max_distance
-        self.modifier = modifier
+        super().__init__(modifier)
 
     def handle(self, sat: SatPosition, rgb: RGB) -> RGB:
         if sat.distance == -1:
-            raise Warning(
+            warnings.warn(
                 "No distance specified with sat, orbit altitude modifier is not support for this reference frame")
             return rgb
         if self.min_distance < sat.distance and self.max_distance > sat.distance:
             rgb += self.modifier
         return rgb
 
+    def mask(self, frame: "SatFrame") -> np.ndarray | None:
+        distance = frame.distance_km
+        known = distance != -1
+        if not known.all():
+            warnings.warn(
+                "No distance specified with sat, orbit altitude modifier is not support for this reference frame")
+        return known & (self.min_distance < distance) & (self.max_distance > distance)
+
     def info(self) -> str:
         return f"{self.modifier.info()} if distance from observer is between {self.min_distance}km and {self.max_distance}km"
@@ -1,13 +1,56 @@
 """downloads, caches and loads data from CelesTrak"""
-from typing import List, Dict
+from typing import List, Dict, Mapping, Tuple
 
 import os
-from csv import DictReader
+from time import time
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from csv import reader
 
-from skyfield.api import load
+from skyfield.api import Loader, load
+from skyfield.constants import DAY_S
 
 from .models import Sat, Sats
 
+# without progress bars, which would interleave when downloading in parallel
+_quiet_load = Loader(".", verbose=False)
+
+
+def _is_stale(filepath: str, cache_TTL: float) -> bool:
+    """whether a cached file is missing or older than cache_TTL, using a single stat call
+
+    Args:
+        filepath: path to cached file
+        cache_TTL: time to use cached data before refreshing, in days
+
+    Returns:
+        bool: whether the file needs downloading
+    """
+    try:
+        return (time() - os.stat(filepath).st_mtime) / DAY_S >= cache_TTL
+    except FileNotFoundError:
+        return True
+
+
+def _download(downloads: List[Tuple[str, str, str]], max_workers: int = 8, verbose: bool = True) -> None:
+    """download files in parallel, as the time is spent waiting on the network
+
+    Args:
+        downloads: list of (url, filepath, message printed once downloaded)
+        max_workers: maximum number of concurrent downloads. Defaults to 8.
+        verbose: print a message as each download finishes. Defaults to True.
+    """
+    if not downloads:
+        return
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(_quiet_load.download, url, filepath): message
+                   for url, filepath, message in downloads}
+        for future in as_completed(futures):
+            future.result()
+            if verbose:
+                print(futures[future])
+
 
 class NORADSource:
     """NORADSource represents a source (data query results) from CelesTrak
@@ -17,6 +60,7 @@ class NORADSource:
     Usage:
         >>> active_sources = NORADSource("active")
     """
+    __slots__ = ("group", "category", "_format")
 
     def __init__(self, group: str, category: str, format: str = "csv") -> None:
         self.group = group.lower()
@@ -39,7 +83,7 @@ class NORAD:
         Data is retrieved from CelesTrak
     """
 
-    def __init__(self, path: str = "./data/NORAD/", cache_TTL: float = 7.0, filetype: str = "csv") -> None:
+    def __init__(self, path: str = "./data/NORAD/", cache_TTL: float = 7.0, filetype: str = "csv", verbose: bool = True) -> None:
         """Object to haddle downloading NORAD data from CelesTrak
 
         Notes:
@@ -48,9 +92,11 @@ class NORAD:
         Args:
             path: path to save cached data. Defaults to "./data/NORAD/".
             cache_TTL: time to use cached data before refreshing, in days. Defaults to 7.0.
+            verbose: print progress when updating and loading sources. Defaults to True.
         """
         self.path = path
         self._cache_TTL = cache_TTL
+        self.verbose = verbose
         self._sources_by_group = {
             **{group: NORADSource(group, "weather & earth resources", filetype) for group in ["weather", "noaa", "goes", "resource", "sarsat", "dmc", "tdrss", "argos", "planet", "spire"]},
             **{group: NORADSource(group, "communications", filetype) for group in ["geo", "gpz", "intelsat", "iridium", "starlink", "orbcomm", "swarm", "x-comm", "gpz-plus", "ses", "iridium-NEXT", "oneweb", "globalstar", "amateur", "other-comm", "satnogs", "gorizont", "raduga", "molniya"]},
@@ -71,15 +117,14 @@ class NORAD:
 
     def update_sources(self) -> None:
         # create source directory if not exists
-        if not os.path.exists(self.path):
-            os.makedirs(self.path)
+        os.makedirs(self.path, exist_ok=True)
 
         # update sources
-        for source in self.sources:
-            filepath = self.path + source.filename
-            if not load.exists(filepath) or load.days_old(filepath) >= self._cache_TTL:
-                load.download(source.url, filepath)
-                print(f"Updated {source.group} NORAD data sources")
+        _download([
+            (source.url, filepath, f"Updated {source.group} NORAD data sources")
+            for source in self.sources
+            if _is_stale(filepath := self.path + source.filename, self._cache_TTL)
+        ], verbose=self.verbose)
 
     def load_sats(self, sources: List[NORADSource]) -> Sats:
         # load specified sources
@@ -88,14 +133,18 @@ class NORAD:
         for source in sources:
             filepath = self.path + source.filename
             with load.open(filepath, mode="r") as f:
-                data = list(DictReader(f))
+                # zipping rows with the header is cheaper than DictReader
+                rows = reader(f)
+                header = next(rows, [])
 
-                sats.extend([Sat(fields, source.group, source.category)
-                            for fields in data])
-                print(f"Loaded {source.group} NORAD data sources {' '*40}",
-                      end="\r")
+                sats.extend(Sat(dict(zip(header, row)), source.group, source.category)
+                            for row in rows if row)
+                if self.verbose:
+                    print(f"Loaded {source.group} NORAD data sources {' '*40}",
+                          end="\r")
 
-        print(f"Loaded all {len(sources)} NORAD data sources {' '*40}")
+        if self.verbose:
+            print(f"Loaded all {len(sources)} NORAD data sources {' '*40}")
 
         return Sats(sats)
 
@@ -105,15 +154,42 @@ class NORAD:
 
 
 class SATCATSource:
+    __slots__ = ("url", "filename")
+
     def __init__(self, url: str, filename: str) -> None:
         self.url = url
         self.filename = filename
 
 
 class SATCAT:
-    def __init__(self, path: str = "./data/SATCAT/", cache_TTL: float = 7.0) -> None:
+    _cache: Dict[tuple, Mapping[str, Mapping[str, str]]] = {}
+    """last loaded SATCAT data, keyed by the path and modification time of each source file"""
+
+    # lookup tables from SATCAT codes to human readable descriptions
+    _OBJECT_TYPE_LOOKUP = {
+        "PAY": "Payload", "R/B": "Rocket body",
+        "DEB": "Other debris", "UNK": "Unknown"
+    }
+    _OPERATIONAL_STATUS_LOOKUP = {
+        "+": "Operational", "-": "Nonoperational",
+        "P": "Partially Operational*Partially fulfilling primary mission or secondary mission(s)*", "B": "Backup/Standby*Previously operational satellite put into reserve status*", "S": "Spare*New satellite awaiting full activation*", "X": "Extended Mission", "D": "Decayed", "?": "Unknown"
+    }
+    _OWNER_LOOKUP = {
+        "AB": "Arab Satellite Communications Organization", "ABS": "Asia Broadcast Satellite", "AC": "Asia Satellite Telecommunications Company (ASIASAT)",
+        "ALG": "Algeria", "ANG": "Angola", "ARGN": "Argentina", "ARM": "Republic of Armenia", "ASRA": "Austria", "AUS": "Australia", "AZER": "Azerbaijan", "BEL": "Belgium", "BELA": "Belarus", "BERM": "Bermuda", "BGD": "Peoples Republic of Bangladesh", "BHUT": "Kingdom of Bhutan", "BOL": "Bolivia", "BRAZ": "Brazil", "BUL": "Bulgaria", "CA": "Canada", "CHBZ": "China/Brazil", "CHTU": "China/Turkey", "CHLE": "Chile", "CIS": "Commonwealth of Independent States (former USSR)", "COL": "Colombia", "CRI": "Republic of Costa Rica", "CZCH": "Czech Republic (former Czechoslovakia)", "DEN": "Denmark", "DJI": "Republic of Djibouti", "ECU": "Ecuador", "EGYP": "Egypt", "ESA": "European Space Agency", "ESRO": "European Space Research Organization", "EST": "Estonia", "ETH": "Ethiopia", "EUME": "European Organization for the Exploitation of Meteorological Satellites (EUMETSAT)", "EUTE": "European Telecommunications Satellite Organization (EUTELSAT)", "FGER": "France/Germany", "FIN": "Finland", "FR": "France", "FRIT": "France/Italy", "GER": "Germany", "GHA": "Republic of Ghana", "GLOB": "Globalstar", "GREC": "Greece", "GRSA": "Greece/Saudi Arabia", "GUAT": "Guatemala", "HUN": "Hungary", "IM": "International Mobile Satellite Organization (INMARSAT)", "IND": "India", "INDO": "Indonesia", "IRAN": "Iran", "IRAQ": "Iraq", "IRID": "Iridium", "IRL": "Ireland", "ISRA": "Israel", "ISRO": "Indian Space Research Organisation", "ISS": "International Space Station", "IT": "Italy", "ITSO": "International Telecommunications Satellite Organization (INTELSAT)", "JPN": "Japan", "KAZ": "Kazakhstan", "KEN": "Republic of Kenya", "LAOS": "Laos", "LKA": "Democratic Socialist Republic of Sri Lanka", "LTU": "Lithuania", "LUXE": "Luxembourg", "MA": "Morroco", "MALA": "Malaysia", "MCO": "Principality of Monaco", "MDA": "Republic of Moldova", "MEX": "Mexico", "MMR": "Republic of the Union of Myanmar", "MNG": "Mongolia", "MUS": "Mauritius", "NATO": "North Atlantic Treaty Organization", "NETH": "Netherlands", "NICO": "New ICO", "NIG": "Nigeria", "NKOR": "Democratic People's Republic of Korea", "NOR": "Norway", "NPL": "Federal Democratic Republic of Nepal", "NZ": "New Zealand", "O3B": "O3b Networks", "ORB": "ORBCOMM", "PAKI": "Pakistan", "PERU": "Peru", "POL": "Poland", "POR": "Portugal", "PRC": "People's Republic of China", "PRY": "Republic of Paraguay", "PRES": "People's Republic of China/European Space Agency", "QAT": "State of Qatar", "RASC": "RascomStar-QAF", "ROC": "Taiwan (Republic of China)", "ROM": "Romania", "RP": "Philippines (Republic of the Philippines)", "RWA": "Republic of Rwanda", "SAFR": "South Africa", "SAUD": "Saudi Arabia", "SDN": "Republic of Sudan", "SEAL": "Sea Launch", "SES": "SES", "SGJP": "Singapore/Japan", "SING": "Singapore", "SKOR": "Republic of Korea", "SPN": "Spain", "STCT": "Singapore/Taiwan", "SVN": "Slovenia", "SWED": "Sweden", "SWTZ": "Switzerland", "TBD": "To Be Determined", "THAI": "Thailand", "TMMC": "Turkmenistan/Monaco", "TUN": "Republic of Tunisia", "TURK": "Turkey", "UAE": "United Arab Emirates", "UK": "United Kingdom", "UKR": "Ukraine", "UNK": "Unknown", "URY": "Uruguay", "US": "United States", "USBZ": "United States/Brazil", "VAT": "Vatican City State", "VENZ": "Venezuela", "VTNM": "Vietnam", "ZWE": "Republic of Zimbabwe"
+    }
+    _LAUNCH_SITE_LOOKUP = {
+        "AFETR": "Air Force Eastern Test Range, Florida, USA", "AFWTR": "Air Force Western Test Range, California, USA", "CAS": "Canaries Airspace", "DLS": "Dombarovskiy Launch Site, Russia", "ERAS": "Eastern Range Airspace", "FRGUI": "Europe's Spaceport, Kourou, French Guiana", "HGSTR": "Hammaguira Space Track Range, Algeria", "JJSLA": "Jeju Island Sea Launch Area, Republic of Korea", "JSC": "Jiuquan Space Center, PRC", "KODAK": "Kodiak Launch Complex, Alaska, USA", "KSCUT": "Uchinoura Space Center(Fomerly Kagoshima Space Center—University of Tokyo, Japan)", "KWAJ": "US Army Kwajalein Atoll (USAKA)", "KYMSC": "Kapustin Yar Missile and Space Complex, Russia", "NSC": "Naro Space Complex, Republic of Korea", "PLMSC": "Plesetsk Missile and Space Complex, Russia", "RLLB": "Rocket Lab Launch Base, Mahia Peninsula, New Zealand", "SCSLA": "South China Sea Launch Area, PRC", "SEAL": "Sea Launch Platform (mobile)", "SEMLS": "Semnan Satellite Launch Site, Iran", "SMTS": "Shahrud Missile Test Site, Iran", "SNMLP": "San Marco Launch Platform, Indian Ocean (Kenya)", "SPKII": "Space Port Kii, Japan", "SRILR": "Satish Dhawan Space Centre, India(Formerly Sriharikota Launching Range)", "SUBL": "Submarine Launch Platform (mobile)", "SVOBO": "Svobodnyy Launch Complex, Russia", "TAISC": "Taiyuan Space Center, PRC", "TANSC": "Tanegashima Space Center, Japan", "TYMSC": "Tyuratam Missile and Space Center, Kazakhstan(Also known as Baikonur Cosmodrome)", "UNK": "Unknown", "VOSTO": "Vostochny Cosmodrome, Russia", "WLPIS": "Wallops Island, Virginia, USA", "WOMRA": "Woomera, Australia", "WRAS": "Western Range Airspace", "WSC": "Wenchang Satellite Launch Site, PRC", "XICLF": "Xichang Launch Facility, PRC", "YAVNE": "Yavne Launch Facility, Israel", "YSLA": "Yellow Sea Launch Area, PRC", "YUN": "Yunsong Launch Site(Sohae Satellite Launching Station),Democratic People's Republic of Korea (North Korea)"
+    }
+    _ORBIT_TYPE_LOOKUP = {
+        "ORB": "Orbit", "LAN": "Landing",
+        "IMP": "Impact", "DOC": "Docked", "R/T": "Roundtrip"
+    }
+
+    def __init__(self, path: str = "./data/SATCAT/", cache_TTL: float = 7.0, verbose: bool = True) -> None:
         self.path = path
         self._cache_TTL = cache_TTL
+        self.verbose = verbose
         self.sources = [SATCATSource(
             "https://celestrak.org/pub/satcat.csv", "satcat.csv")]
 
@@ -121,33 +197,45 @@ class SATCAT:
         """updates the SATCAT sources from CelesTrak if they are older than cache_TTL
         """
         # create source directory if not exists
-        if not os.path.exists(self.path):
-            os.makedirs(self.path)
+        os.makedirs(self.path, exist_ok=True)
 
         # update sources
-        for source in self.sources:
-            filepath = self.path + source.filename
-            if not load.exists(filepath) or load.days_old(filepath) >= self._cache_TTL:
-                load.download(source.url, filepath)
-                print(f"Updated SATCAT data sources")
+        _download([
+            (source.url, filepath, f"Updated SATCAT data sources")
+            for source in self.sources
+            if _is_stale(filepath := self.path + source.filename, self._cache_TTL)
+        ], verbose=self.verbose)
 
-    def load(self) -> Dict[str, Dict]:
-        """load all SATCAT data and return n a dict of dicts indexed by sat name
+    def load(self) -> Mapping[str, Mapping[str, str]]:
+        """load all SATCAT data and return a read-only mapping of records indexed by sat name
+
+        the result is shared between every SATCAT loading the same files and reused until any of them are modified, so it is read-only
 
         Returns:
             SATCAT data indexed by Sat name
         """
+        filepaths = [self.path + source.filename for source in self.sources]
+        key = tuple((os.path.abspath(filepath), os.stat(filepath).st_mtime)
+                    for filepath in filepaths)
+        if key in SATCAT._cache:
+            return SATCAT._cache[key]
+
         sats = []
 
         for source in self.sources:
             filepath = self.path + source.filename
             with load.open(filepath, mode="r") as f:
-                data = list(DictReader(f))
+                rows = reader(f)
+                header = next(rows, [])
 
-                sats.extend(data)
-                print(f"Loaded {source.filename} SATCAT data source")
+                sats.extend(dict(zip(header, row)) for row in rows if row)
+                if self.verbose:
+                    print(f"Loaded {source.filename} SATCAT data source")
 
-        return {sat['OBJECT_NAME']: sat for sat in sats}
+        # only the latest load is kept
+        SATCAT._cache = {key: MappingProxyType(
+            {sat['OBJECT_NAME']: MappingProxyType(sat) for sat in sats})}
+        return SATCAT._cache[key]
 
     @classmethod
     def OBJECT_TYPE(cls, object_type: str) -> str:
@@ -159,13 +247,7 @@ class SATCAT:
         Returns:
             Human readable description
         """
-        lookup_table = {
-            "PAY": "Payload", "R/B": "Rocket body",
-            "DEB": "Other debris", "UNK": "Unknown"
-        }
-        if object_type in lookup_table:
-            return lookup_table[object_type]
-        return ""
+        return cls._OBJECT_TYPE_LOOKUP.get(object_type, "")
 
     @classmethod
     def OPERATIONAL_STATUS(cls, operational_status: str) -> str:
@@ -177,13 +259,7 @@ class SATCAT:
         Returns:
             Human readable operational status
         """
-        lookup_table = {
-            "+": "Operational", "-": "Nonoperational",
-            "P": "Partially Operational*Partially fulfilling primary mission or secondary mission(s)*", "B": "Backup/Standby*Previously operational satellite put into reserve status*", "S": "Spare*New satellite awaiting full activation*", "X": "Extended Mission", "D": "Decayed", "?": "Unknown"
-        }
-        if operational_status in lookup_table:
-            return lookup_table[operational_status]
-        return ""
+        return cls._OPERATIONAL_STATUS_LOOKUP.get(operational_status, "")
 
     @classmethod
     def OWNER(cls, owner: str) -> str:
@@ -195,13 +271,7 @@ class SATCAT:
         Returns:
             Human readable owner
         """
-        lookup_table = {
-            "AB": "Arab Satellite Communications Organization", "ABS": "Asia Broadcast Satellite", "AC": "Asia Satellite Telecommunications Company (ASIASAT)",
-            "ALG": "Algeria", "ANG": "Angola", "ARGN": "Argentina", "ARM": "Republic of Armenia", "ASRA": "Austria", "AUS": "Australia", "AZER": "Azerbaijan", "BEL": "Belgium", "BELA": "Belarus", "BERM": "Bermuda", "BGD": "Peoples Republic of Bangladesh", "BHUT": "Kingdom of Bhutan", "BOL": "Bolivia", "BRAZ": "Brazil", "BUL": "Bulgaria", "CA": "Canada", "CHBZ": "China/Brazil", "CHTU": "China/Turkey", "CHLE": "Chile", "CIS": "Commonwealth of Independent States (former USSR)", "COL": "Colombia", "CRI": "Republic of Costa Rica", "CZCH": "Czech Republic (former Czechoslovakia)", "DEN": "Denmark", "DJI": "Republic of Djibouti", "ECU": "Ecuador", "EGYP": "Egypt", "ESA": "European Space Agency", "ESRO": "European Space Research Organization", "EST": "Estonia", "ETH": "Ethiopia", "EUME": "European Organization for the Exploitation of Meteorological Satellites (EUMETSAT)", "EUTE": "European Telecommunications Satellite Organization (EUTELSAT)", "FGER": "France/Germany", "FIN": "Finland", "FR": "France", "FRIT": "France/Italy", "GER": "Germany", "GHA": "Republic of Ghana", "GLOB": "Globalstar", "GREC": "Greece", "GRSA": "Greece/Saudi Arabia", "GUAT": "Guatemala", "HUN": "Hungary", "IM": "International Mobile Satellite Organization (INMARSAT)", "IND": "India", "INDO": "Indonesia", "IRAN": "Iran", "IRAQ": "Iraq", "IRID": "Iridium", "IRL": "Ireland", "ISRA": "Israel", "ISRO": "Indian Space Research Organisation", "ISS": "International Space Station", "IT": "Italy", "ITSO": "International Telecommunications Satellite Organization (INTELSAT)", "JPN": "Japan", "KAZ": "Kazakhstan", "KEN": "Republic of Kenya", "LAOS": "Laos", "LKA": "Democratic Socialist Republic of Sri Lanka", "LTU": "Lithuania", "LUXE": "Luxembourg", "MA": "Morroco", "MALA": "Malaysia", "MCO": "Principality of Monaco", "MDA": "Republic of Moldova", "MEX": "Mexico", "MMR": "Republic of the Union of Myanmar", "MNG": "Mongolia", "MUS": "Mauritius", "NATO": "North Atlantic Treaty Organization", "NETH": "Netherlands", "NICO": "New ICO", "NIG": "Nigeria", "NKOR": "Democratic People's Republic of Korea", "NOR": "Norway", "NPL": "Federal Democratic Republic of Nepal", "NZ": "New Zealand", "O3B": "O3b Networks", "ORB": "ORBCOMM", "PAKI": "Pakistan", "PERU": "Peru", "POL": "Poland", "POR": "Portugal", "PRC": "People's Republic of China", "PRY": "Republic of Paraguay", "PRES": "People's Republic of China/European Space Agency", "QAT": "State of Qatar", "RASC": "RascomStar-QAF", "ROC": "Taiwan (Republic of China)", "ROM": "Romania", "RP": "Philippines (Republic of the Philippines)", "RWA": "Republic of Rwanda", "SAFR": "South Africa", "SAUD": "Saudi Arabia", "SDN": "Republic of Sudan", "SEAL": "Sea Launch", "SES": "SES", "SGJP": "Singapore/Japan", "SING": "Singapore", "SKOR": "Republic of Korea", "SPN": "Spain", "STCT": "Singapore/Taiwan", "SVN": "Slovenia", "SWED": "Sweden", "SWTZ": "Switzerland", "TBD": "To Be Determined", "THAI": "Thailand", "TMMC": "Turkmenistan/Monaco", "TUN": "Republic of Tunisia", "TURK": "Turkey", "UAE": "United Arab Emirates", "UK": "United Kingdom", "UKR": "Ukraine", "UNK": "Unknown", "URY": "Uruguay", "US": "United States", "USBZ": "United States/Brazil", "VAT": "Vatican City State", "VENZ": "Venezuela", "VTNM": "Vietnam", "ZWE": "Republic of Zimbabwe"
-        }
-        if owner in lookup_table:
-            return lookup_table[owner]
-        return ""
+        return cls._OWNER_LOOKUP.get(owner, "")
 
     @classmethod
     def LAUNCH_SITE(cls, launch_site: str) -> str:
@@ -213,12 +283,7 @@ class SATCAT:
         Returns:
             Human readable launch site
         """
-        lookup_table = {
-            "AFETR": "Air Force Eastern Test Range, Florida, USA", "AFWTR": "Air Force Western Test Range, California, USA", "CAS": "Canaries Airspace", "DLS": "Dombarovskiy Launch Site, Russia", "ERAS": "Eastern Range Airspace", "FRGUI": "Europe's Spaceport, Kourou, French Guiana", "HGSTR": "Hammaguira Space Track Range, Algeria", "JJSLA": "Jeju Island Sea Launch Area, Republic of Korea", "JSC": "Jiuquan Space Center, PRC", "KODAK": "Kodiak Launch Complex, Alaska, USA", "KSCUT": "Uchinoura Space Center(Fomerly Kagoshima Space Center—University of Tokyo, Japan)", "KWAJ": "US Army Kwajalein Atoll (USAKA)", "KYMSC": "Kapustin Yar Missile and Space Complex, Russia", "NSC": "Naro Space Complex, Republic of Korea", "PLMSC": "Plesetsk Missile and Space Complex, Russia", "RLLB": "Rocket Lab Launch Base, Mahia Peninsula, New Zealand", "SCSLA": "South China Sea Launch Area, PRC", "SEAL": "Sea Launch Platform (mobile)", "SEMLS": "Semnan Satellite Launch Site, Iran", "SMTS": "Shahrud Missile Test Site, Iran", "SNMLP": "San Marco Launch Platform, Indian Ocean (Kenya)", "SPKII": "Space Port Kii, Japan", "SRILR": "Satish Dhawan Space Centre, India(Formerly Sriharikota Launching Range)", "SUBL": "Submarine Launch Platform (mobile)", "SVOBO": "Svobodnyy Launch Complex, Russia", "TAISC": "Taiyuan Space Center, PRC", "TANSC": "Tanegashima Space Center, Japan", "TYMSC": "Tyuratam Missile and Space Center, Kazakhstan(Also known as Baikonur Cosmodrome)", "UNK": "Unknown", "VOSTO": "Vostochny Cosmodrome, Russia", "WLPIS": "Wallops Island, Virginia, USA", "WOMRA": "Woomera, Australia", "WRAS": "Western Range Airspace", "WSC": "Wenchang Satellite Launch Site, PRC", "XICLF": "Xichang Launch Facility, PRC", "YAVNE": "Yavne Launch Facility, Israel", "YSLA": "Yellow Sea Launch Area, PRC", "YUN": "Yunsong Launch Site(Sohae Satellite Launching Station),Democratic People's Republic of Korea (North Korea)"
-        }
-        if launch_site in lookup_table:
-            return lookup_table[launch_site]
-        return ""
+        return cls._LAUNCH_SITE_LOOKUP.get(launch_site, "")
 
     @classmethod
     def ORBIT_TYPE(cls, orbit_type: str) -> str:
@@ -230,13 +295,7 @@ class SATCAT:
         Returns:
             Human readable orbit type
         """
-        lookup_table = {
-            "ORB": "Orbit", "LAN": "Landing",
-            "IMP": "Impact", "DOC": "Docked", "R/T": "Roundtrip"
-        }
-        if orbit_type in lookup_table:
-            return lookup_table[orbit_type]
-        return ""
+        return cls._ORBIT_TYPE_LOOKUP.get(orbit_type, "")
 
 
 def init_sats() -> Sats:
@@ -5,22 +5,41 @@ see README for api spec
 
 from src.matrix import RGB, ImageFrame
 from .tools import autoport
+import base64
+import numpy as np
 import serial
 
 
 class LiveInterface:
     _encoding = "utf-8"
+    # max pixels sent per batch command, limits the line length the device has to buffer
+    _batch_size = 256
+    # batch commands pack each coordinate into a single byte
+    _max_cells = 256
 
     def __init__(self, port: str = "", baudrate: int = 115200) -> None:
         if not port:
             port = autoport()
 
         self.conn = serial.Serial(port, baudrate)
+        # larger driver buffers so a whole frame is queued in one write, only supported on Windows
+        if hasattr(self.conn, "set_buffer_size"):
+            self.conn.set_buffer_size(rx_size=1 << 16, tx_size=1 << 16)
 
-        self._last_frame: ImageFrame = None  # type:ignore
+        # pixels currently shown on the device, copied so later changes to a frame are still sent
+        self._last_pixels: np.ndarray = None  # type:ignore
 
         print(f"Connected to device on port: {port}")
 
+    def _encode_csv(self, op: int, *args) -> bytes:
+        """encode a command to be sent to the device
+
+        Args:
+            op: op code
+            args: args
+        """
+        return f"{op},{','.join(map(str, args))}\n".encode(self._encoding)
+
     def _send_csv(self, op: int, *args) -> None:
         """send command over serial to device
 
@@ -28,8 +47,109 @@ class LiveInterface:
             op: op code
             args: args
         """
-        self.conn.write(
-            f"{op},{','.join([str(arg) for arg in args])}\n".encode(self._encoding))
+        self.conn.write(self._encode_csv(op, *args))
+
+    def _check_batch_size(self, width: int, height: int) -> None:
+        """raise an error if a display is too large for the one byte coordinates of batch commands
+
+        Args:
+            width: number of cells in the x direction
+            height: number of cells in the y direction
+
+        Raises:
+            ValueError: width or height is more than `_max_cells`
+        """
+        if width > self._max_cells or height > self._max_cells:
+            raise ValueError(
+                f"batch commands support displays up to {self._max_cells}x{self._max_cells} cells, not {width}x{height}, increase the device cell_size")
+
+    def _encode_batches(self, op: int, records: bytes, record_size: int) -> bytes:
+        """encode packed records as batch commands of at most `_batch_size` records
+
+        Args:
+            op: batch op code
+            records: packed records
+            record_size: bytes per record
+
+        Returns:
+            encoded commands
+        """
+        step = record_size * self._batch_size
+        # base64 encoded so no control characters (e.g. ctrl-c) are sent
+        return b"".join(
+            self._encode_csv(op, base64.b64encode(
+                records[i:i + step]).decode("ascii"))
+            for i in range(0, len(records), step)
+        )
+
+    def _encode_pixel_batches(self, records: bytes) -> bytes:
+        """encode packed x, y, r, g, b pixel records as batch commands of at most `_batch_size` pixels
+
+        Args:
+            records: 5 bytes per pixel
+
+        Returns:
+            encoded commands
+        """
+        return self._encode_batches(6, records, 5)
+
+    @staticmethod
+    def _pack(pixels: np.ndarray) -> np.ndarray:
+        """pack RGB pixels into 0x00RRGGBB ints
+
+        Args:
+            pixels: (height, width, 3) uint8 pixels
+
+        Returns:
+            (height, width) uint32 packed pixels
+        """
+        pixels = pixels.astype(np.uint32)
+        return (pixels[..., 0] << 16) | (pixels[..., 1] << 8) | pixels[..., 2]
+
+    def _encode_diff(self, prev: np.ndarray, next: np.ndarray) -> bytes:
+        """encode the pixels that differ between two frames as batch commands, as runs of same coloured pixels along each row when that is smaller
+
+        Args:
+            prev: (height, width, 3) uint8 pixels currently shown on the device
+            next: (height, width, 3) uint8 pixels to show
+
+        Returns:
+            encoded commands, empty if nothing changed
+        """
+        self._check_batch_size(next.shape[1], next.shape[0])
+
+        # pack each pixel into one 0x00RRGGBB int so pixels and runs are compared with a single comparison
+        colour = self._pack(next)
+        changed = self._pack(prev) != colour
+        ys, xs = np.nonzero(changed)
+        if not len(xs):
+            return b""
+
+        # unchanged pixels never join a run, as no packed colour has the top byte set
+        colour[~changed] = 0xFFFFFFFF
+        boundary = colour[:, 1:] != colour[:, :-1]
+        edge = np.ones((colour.shape[0], 1), dtype=bool)
+        run_ys, run_xs = np.nonzero(
+            changed & np.concatenate((edge, boundary), axis=1))
+
+        _, end_xs = np.nonzero(
+            changed & np.concatenate((boundary, edge), axis=1))
+        lengths = end_xs - run_xs + 1
+
+        # the length is a single byte, so runs longer than 255 are split into several runs
+        parts = (lengths + 254) // 255
+        run = np.repeat(np.arange(len(lengths)), parts)
+        offsets = 255 * (np.arange(len(run)) -
+                         np.repeat(np.cumsum(parts) - parts, parts))
+
+        # a run is 6 bytes and a pixel 5, so only send runs when there are enough adjacent pixels
+        if 6 * len(run) >= 5 * len(xs):
+            records = np.column_stack((xs, ys, next[ys, xs])).astype(np.uint8)
+            return self._encode_pixel_batches(records.tobytes())
+
+        records = np.column_stack(
+            (run_xs[run] + offsets, run_ys[run], np.minimum(lengths[run] - offsets, 255), next[run_ys[run], run_xs[run]])).astype(np.uint8)
+        return self._encode_batches(8, records.tobytes(), 6)
 
     def set_pixel(self, x: int, y: int, rgb: RGB) -> None:
         """set the devices pixel to colour rgb
@@ -39,7 +159,38 @@ class LiveInterface:
             y: y position
             rgb: RGB object
         """
-        self._send_csv(1, x, y, *rgb.to_tuple())
+        # formatted straight to bytes as every arg is an int
+        self.conn.write(b"1,%d,%d,%d,%d,%d\n" % (x, y, rgb.R, rgb.G, rgb.B))
+
+    def set_pixels(self, pixels: list[tuple[int, int, RGB]]) -> None:
+        """draw many of the devices pixels, these are shown once `flush` is called
+
+        Args:
+            pixels: list of (x, y, RGB object)
+        """
+        records = bytearray()
+        for x, y, rgb in pixels:
+            if not (0 <= x < self._max_cells and 0 <= y < self._max_cells):
+                raise ValueError(
+                    f"batch commands support x and y from 0 to {self._max_cells - 1}, not ({x}, {y}), increase the device cell_size")
+            records.extend((x, y, rgb.R, rgb.G, rgb.B))
+        self.conn.write(self._encode_pixel_batches(bytes(records)))
+
+    def push_diff(self, prev: np.ndarray, next: np.ndarray) -> None:
+        """send only the pixels that differ between two frames and show them, in a single write
+
+        Args:
+            prev: (height, width, 3) uint8 pixels currently shown on the device
+            next: (height, width, 3) uint8 pixels to show
+        """
+        commands = self._encode_diff(prev, next)
+        if commands:
+            self.conn.write(commands + self._encode_csv(7))
+
+    def flush(self) -> None:
+        """update the display with all pixels drawn since the last flush
+        """
+        self._send_csv(7)
 
     def clear_display(self) -> None:
         """clear the display
@@ -54,14 +205,10 @@ class LiveInterface:
         """
         self._send_csv(3)
 
-        while True:
-            raw = self.conn.readline()
-            if raw:
-                args = raw.decode(self._encoding).strip(
-                    "\r\n").strip().split(",")
-
-                row, col, *_ = args
-                return int(row), int(col)
+        # a single blocking read of the reply line
+        raw = self.conn.read_until(b"\n")
+        row, col, *_ = raw.decode(self._encoding).strip().split(",")
+        return int(row), int(col)
 
     def _debug_print_serial(self) -> None:
         while True:
@@ -76,22 +223,18 @@ class LiveInterface:
         Args:
             frame: ImageFrame to be displayed
         """
-        # create a blank frame for comparison if it doesn't exist
-        if not self._last_frame:
-            self._last_frame = frame._matrix._empty_frame()
-            self.clear_display()
+        pixels = frame.to_numpy_rgb()
 
-        # update pixels that require update
-        def update_px(x, y):
-            last_pixel = self._last_frame.get_pixel(x, y)
-            pixel = frame.get_pixel(x, y)
+        # create blank pixels for comparison if they don't exist
+        if self._last_pixels is None or self._last_pixels.shape != pixels.shape:
+            self._last_pixels = np.zeros_like(pixels)
+            self.clear_display()
 
-            if last_pixel != pixel:
-                self.set_pixel(x, y, pixel)
-        frame._for_grid(update_px)
+        # send only the pixels that changed
+        self.push_diff(self._last_pixels, pixels)
 
-        # save frame for next update
-        self._last_frame = frame
+        # save pixels for next update, reusing the buffer
+        self._last_pixels[:] = pixels
 
     def randomise(self) -> None:
         import time
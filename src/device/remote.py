@@ -6,6 +6,7 @@
 from .pyboard import Pyboard
 from .tools import autoport
 import datetime
+import time
 
 
 class RemoteInterface:
@@ -17,6 +18,9 @@ class RemoteInterface:
     """
     # ! Unplug and replug to start program
 
+    # max bytes of source sent per exec, the source is compiled on the device so this is limited by its RAM
+    _chunk_size = 4096
+
     def __init__(self, port: str = "", baudrate: int = 115200) -> None:
         if not port:
             port = autoport()
@@ -43,8 +47,22 @@ class RemoteInterface:
         Args:
             dir: absolute dir path
         """
-        if not self._pyb.fs_exists(dir):
-            self._pyb.fs_mkdir(dir)
+        self._create_dirs_if_not_exist([dir])
+
+    def _create_dirs_if_not_exist(self, dirs: list[str]) -> None:
+        """create absolute dirs on the remote device if they don't already exist, in a single round trip
+
+        parents must come before their children in dirs
+
+        Args:
+            dirs: absolute dir paths
+        """
+        if not dirs:
+            return
+
+        # mkdir raises OSError if the dir exists, which is cheaper than checking with a separate stat
+        self._pyb.exec_(
+            f"import os\nfor d in {dirs!r}:\n try:\n  os.mkdir(d)\n except OSError:\n  pass")
 
     def put(self, src: str, dst: str) -> None:
         """copy the file src to the location dst on the remote device.
@@ -57,7 +75,74 @@ class RemoteInterface:
             src: path (and filename) to file on PC
             dst: path (and filename) on remote device
         """
-        self._pyb.fs_put(src, dst)
+        self._pyb.fs_put(src, dst, chunk_size=self._chunk_size)
+
+    def put_module(self, src: str, dst: str, precompile: bool = False) -> None:
+        """copy the python module src to the location dst on the remote device, optionally precompiled to .mpy so the device doesn't compile it on import
+
+        precompiling requires mpy-cross on the PATH, matching the MicroPython version of the device firmware. falls back to copying the source if it isn't installed
+
+        Args:
+            src: path (and filename) to .py file on PC
+            dst: path (and filename) of the .py file on remote device
+            precompile: compile with mpy-cross before copying. Defaults to False.
+        """
+        import shutil
+        mpy_cross = shutil.which("mpy-cross") if precompile else None
+        if precompile and mpy_cross is None:
+            print("mpy-cross not found, copying source instead")
+
+        if mpy_cross is None:
+            self.put(src, dst)
+            return
+
+        import os
+        import subprocess
+        import tempfile
+        with tempfile.TemporaryDirectory() as tmp:
+            mpy = os.path.join(tmp, "module.mpy")
+            subprocess.run([mpy_cross, "-O3", "-march=armv6m", "-o", mpy, src],
+                           check=True)
+            self.put(mpy, dst.removesuffix(".py") + ".mpy")
+
+        # .py is imported before .mpy so remove any stale source
+        self._pyb.exec_(
+            f"import os\ntry:\n os.remove({dst!r})\nexcept OSError:\n pass")
+
+    def put_many(self, files: list[tuple[str, str]]) -> None:
+        """copy many files to the remote device, small files are batched so several are written per exec instead of three execs per file
+
+        the directories must already exist or an error will occur
+
+        Args:
+            files: list of (src, dst) as in `put`
+        """
+        batch: list[tuple[str, bytes]] = []
+        batch_size = 0
+
+        def write_batch() -> None:
+            self._pyb.exec_(
+                f"for n, d in {batch!r}:\n with open(n, 'wb') as f:\n  f.write(d)")
+            batch.clear()
+
+        for src, dst in files:
+            with open(src, "rb") as f:
+                data = f.read()
+            size = len(repr((dst, data)))
+
+            # large files are streamed in chunks
+            if size > self._chunk_size:
+                self.put(src, dst)
+                continue
+
+            if batch_size + size > self._chunk_size:
+                write_batch()
+                batch_size = 0
+            batch.append((dst, data))
+            batch_size += size
+
+        if batch:
+            write_batch()
 
     def copy_file_structure(self, src: str, dst: str) -> None:
         """copy the file structure from the PC to the remote fs
@@ -68,58 +153,76 @@ class RemoteInterface:
         """
         from pathlib import Path
         rootdir = Path(src)
-        self._create_dir_if_not_exist(dst)
+
+        # walk the tree once, splitting dirs and files
+        dirs = [dst]
+        files = []
         for f in rootdir.rglob("*"):
             src_path = f.as_posix()
             dst_path = dst + "/" + src_path.removeprefix(src)
             if f.is_dir():
-                # create file if not exists
-                self._create_dir_if_not_exist(dst_path)
-                print(f"Create remote dir, {dst_path}")
+                dirs.append(dst_path)
             elif f.is_file():
-                # copy file
-                self.put(src_path, dst_path)
-                print(
-                    f"Copied host file ({src_path}) to remote ({dst_path})")
+                files.append((src_path, dst_path))
+
+        # create all dirs at once, shallowest first so parents exist before children
+        dirs.sort(key=lambda dir: dir.count("/"))
+        self._create_dirs_if_not_exist(dirs)
+        for dst_path in dirs[1:]:
+            print(f"Create remote dir, {dst_path}")
 
-    def tree(self, src: str = "/", *, _depth: int = 0) -> None:
+        # copy files
+        self.put_many(files)
+        for src_path, dst_path in files:
+            print(
+                f"Copied host file ({src_path}) to remote ({dst_path})")
+
+    def tree(self, src: str = "/") -> None:
         """print a linux like tree output of the remote filesystem
 
+        the tree is walked on the device and returned in a single round trip
+
         Args:
             src: source path. Defaults to "/".
-            _depth: internal attribute. do not use. Defaults to 0.
         """
-        import stat
-        if _depth == 0:
-            print(src)
-        for dir in self._pyb.fs_listdir(src):
-            print(f"{'│   '*(_depth)}├── {dir.name}")
-            if stat.S_ISDIR(dir.st_mode):
-                dir_path = src + dir.name + "/"
-                self.tree(dir_path, _depth=_depth+1)
+        out = self._pyb.exec_(
+            "import os\n"
+            "def tree(p, d):\n"
+            " for e in os.ilistdir(p):\n"
+            "  print('\u2502   ' * d + '\u251c\u2500\u2500 ' + e[0])\n"
+            "  if e[1] & 0x4000:\n"
+            "   tree(p + e[0] + '/', d + 1)\n"
+            f"print({src!r})\n"
+            f"tree({src!r}, 0)")
+        print(out.decode("utf-8").replace("\r\n", "\n"), end="")
 
     def delete_dir_and_contents(self, dst: str) -> None:
-        """deleted remote directory and all children with recursive calls
+        """deleted remote directory and all children, walked on the device in a single round trip
 
         this will deleted everything inside of these folders inreversibly
 
-        please ensure dst ends in "/" of this will throw an error
+        please ensure dst ends in "/" of this will throw an error, "" or "/" wipes the contents of the root which itself is kept
 
         Args:
             dst: remote directory to remove along with contents
         """
-        if not self._pyb.fs_exists(dst):
-            return
-
-        import stat
-        for dir in self._pyb.fs_listdir(dst):
-            if stat.S_ISDIR(dir.st_mode):
-                dir_path = dst + dir.name + "/"
-                self.delete_dir_and_contents(dir_path)
-            else:
-                file_path = dst + dir.name
-                self._pyb.fs_rm(file_path)
-        self._pyb.fs_rmdir(dst)
+        # entries are listed before removing so deletes don't disturb the listing
+        self._pyb.exec_(
+            "import os\n"
+            "def rm(p):\n"
+            " for n, t in [(e[0], e[1]) for e in os.ilistdir(p)]:\n"
+            "  if t & 0x4000:\n"
+            "   rm(p + n + '/')\n"
+            "  else:\n"
+            "   os.remove(p + n)\n"
+            " if p not in ('', '/'):\n"
+            "  os.rmdir(p)\n"
+            "try:\n"
+            f" os.stat({dst!r})\n"
+            "except OSError:\n"
+            " pass\n"
+            "else:\n"
+            f" rm({dst!r})")
 
     def set_datetime(self) -> None:
         """set the datetime on the device to the current unix datetime
@@ -128,10 +231,11 @@ class RemoteInterface:
 
         datetime format defined in https://docs.micropython.org/en/latest/library/machine.RTC.html (not standard CPython format)
         """
-        now = datetime.datetime.utcnow()
-        time_tuple = (now.year, now.month, now.day,
-                      now.weekday(), now.hour, now.minute, now.second, now.microsecond/1000000)
-        self._pyb.eval(f'machine.RTC().datetime({time_tuple})')
+        # fields are built on the host from a whole second timestamp so the device only receives ints
+        t = time.gmtime(int(time.time()))
+        time_tuple = (t.tm_year, t.tm_mon, t.tm_mday, t.tm_wday,
+                      t.tm_hour, t.tm_min, t.tm_sec, 0)
+        self._pyb.exec_(f"import machine\nmachine.RTC().datetime({time_tuple})")
 
     def get_datetime(self) -> datetime.datetime:
         """get the current UTC (unix) datetime from the remote device
@@ -139,10 +243,8 @@ class RemoteInterface:
         Returns:
             datetime.datetime object
         """
-        t = str(self._pyb.eval("machine.RTC().datetime()"),
-                encoding="utf8")[1:-1].split(", ")
-        return datetime.datetime(int(t[0]), int(t[1]), int(
-            t[2]), int(t[4]), int(t[5]), int(t[6]))
+        unix_timestamp = int(self._pyb.exec_("import time\nprint(time.time())"))
+        return datetime.datetime.fromtimestamp(unix_timestamp, datetime.timezone.utc).replace(tzinfo=None)
 
     def start_main(self) -> None:
         """starts running the local main.py file on the remote device
@@ -2,13 +2,19 @@
 # TODO: Write docs
 
 import machine  # type: ignore
+from array import array
 from picographics import PicoGraphics
 import uselect  # type: ignore
+import ubinascii  # type: ignore
 import os
 from pngdec import PNG
 import sys
 import time
 
+# overclocked cpu frequency while drawing, and the lowest frequency USB serial still works at while asleep [Hz]
+ACTIVE_FREQ = 200000000
+IDLE_FREQ = 48000000
+
 
 class StopWatch:
     """ms accurate stopwatch"""
@@ -40,11 +46,23 @@ class UntetheredMode:
     _OFFSET_LIVE = 1
     _BACKUP = 2
 
+    # timer limits compared in ms to avoid float conversions in the event loop
+    _FRAME_MS = 1000
+    _SLEEP_MS = 5 * 60 * 1000
+    _BUTTON_MS = 50
+    # idle time per loop while asleep
+    _IDLE_MS = 100
+
     def __init__(self) -> None:
         self.view = 0
         self.frame_timer = StopWatch()
         self.inactivity_timer = StopWatch()
+        self.button_timer = StopWatch()
         self.sleep = False
+        # sorted timestamps for each (playback_mode, view), images are only uploaded over the raw REPL which restarts the program so listings stay valid
+        self._dir_cache = {}
+        # png decoder reused between frames, created on the first frame as it needs the device graphics
+        self._png = None
         self.reset()
 
     def reset(self) -> None:
@@ -72,6 +90,9 @@ class UntetheredMode:
             self.playback_mode = self._OFFSET_LIVE
             self.offset = unix_ts - self.tss[0]
 
+        # root dir of the images for the playback mode
+        self._dir_prefix = "backup_images/" if self.playback_mode == self._BACKUP else "images/"
+
     def handle(self, device: "PicoGraphicsDevice", cell_size: int = 1) -> None:
         """main event loop for untethered mode (outputing images from root)
 
@@ -80,40 +101,46 @@ class UntetheredMode:
             cell_size: number of pixels wide per "sat cell". Defaults to 1.
         """
 
-        # change view if button is pressed
-        btn_pressed, idx = device.button_pressed()
-        if btn_pressed:
-            self.view = idx
+        # idle while asleep rather than spinning, buttons are still polled to wake up
+        if self.sleep:
+            time.sleep_ms(self._IDLE_MS)  # type: ignore
+
+        # change view if button is pressed, polled at most every _BUTTON_MS
+        if self.button_timer.elapsed_ms > self._BUTTON_MS:
+            self.button_timer.reset()
+            btn_pressed, idx = device.button_pressed()
+            if btn_pressed:
+                self.view = idx
 
-            # handle sleep mode
-            self.inactivity_timer.reset()
-            if self.sleep:
-                self.sleep = False
+                # handle sleep mode
+                self.inactivity_timer.reset()
+                if self.sleep:
+                    self.wake()
 
         # sleep if been inactive for 5 minutes
-        if self.inactivity_timer.elapsed_m > 5:
+        if self.inactivity_timer.elapsed_ms > self._SLEEP_MS:
             if not self.sleep:
                 self.sleep = True
                 device.clear_display()
+                # nothing is drawn while asleep so drop the overclock
+                machine.freq(IDLE_FREQ)
 
         else:
             # only execute every second
-            if self.frame_timer.elapsed_s > 1:
+            if self.frame_timer.elapsed_ms > self._FRAME_MS:
                 self.frame_timer.reset()
                 unix_ts = self.unix_time()
 
-                # if image exists
-                if unix_ts in self.tss:
+                # if image exists, found by binary search rather than scanning the list
+                if self._has_ts(unix_ts):
 
-                    png = PNG(device.graphics)
-                    # png = PNG(graphics)
+                    png = self._png
+                    if png is None:
+                        png = self._png = PNG(device.graphics)
 
                     # open image file for respective dir
-                    if self.playback_mode == self._BACKUP:
-                        png.open_file(
-                            f"backup_images/{self.view}/{unix_ts}.png")
-                    else:
-                        png.open_file(f"images/{self.view}/{unix_ts}.png")
+                    png.open_file(
+                        f"{self._dir_prefix}{self.view}/{unix_ts}.png")
 
                     # scale to cell_size and display png
                     png.decode(0, 0, scale=cell_size)
@@ -125,12 +152,36 @@ class UntetheredMode:
                 elif (len(self.tss) != 0) and (unix_ts > self.tss[-1]):
                     self.reset()
 
+    def wake(self) -> None:
+        """leave sleep mode and restore the cpu frequency"""
+        if self.sleep:
+            self.sleep = False
+            machine.freq(ACTIVE_FREQ)
+
     def unix_time(self) -> int:
         return time.time() - self.offset  # type: ignore
 
-    def _list_dir(self) -> list[int]:
-        """return a list of all timestamps for the current view and playback_mode
+    def _has_ts(self, unix_ts: int) -> bool:
+        """return whether an image exists for the timestamp, MicroPython has no bisect module so this is a hand written binary search"""
+        tss = self.tss
+        lo, hi = 0, len(tss)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if tss[mid] < unix_ts:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo < len(tss) and tss[lo] == unix_ts
+
+    def _list_dir(self) -> array:
+        """return sorted timestamps for the current view and playback_mode, cached after the first listing
+
+        timestamps are stored in an unsigned 32 bit array as they are too large for MicroPython small ints and would each be allocated as objects in a list
         """
+        key = (self.playback_mode, self.view)
+        if key in self._dir_cache:
+            return self._dir_cache[key]
+
         dirs = []
 
         # get timestamps from backup dir if in backup mode
@@ -144,9 +195,9 @@ class UntetheredMode:
                 dirs = os.listdir(f"images/{self.view}")
 
         # convert file names to int unix timestamps and sort
-        out = [int(dir[:-4]) for dir in dirs]
-        out.sort()
+        out = array("I", sorted(int(dir[:-4]) for dir in dirs))
 
+        self._dir_cache[key] = out
         return out
 
 
@@ -154,18 +205,21 @@ class PicoGraphicsDevice:
     def __init__(self, display: int, cell_size: int = 1) -> None:
 
         # overclock to 200MHz
-        machine.freq(200000000)
+        machine.freq(ACTIVE_FREQ)
 
         # create and register stdin listener
         self._poll = uselect.poll()
         self._poll.register(sys.stdin, uselect.POLLIN)
 
         self._tethered = True
+        # pixels have been drawn in tethered mode but not yet shown
+        self._dirty = False
 
         # setup graphics
         self._cell_size = cell_size
         self.graphics = PicoGraphics(display)
         self.graphics.set_backlight(1)
+        self._pens = {}
 
         # setup untethered device
         self.untethered_handler = UntetheredMode()
@@ -187,22 +241,29 @@ class PicoGraphicsDevice:
 
         # time without communication from computer to enter untethered mode [ms]
         TIMEOUT = 5000
+        # max time to wait for serial when there is nothing to draw, returns as soon as a msg arrives [ms]
+        IDLE_POLL_MS = 20
 
         try:
             while True:
-                # serial msg sent
-                if self._stdin_ready():
+                # serial msg sent, waiting briefly instead of spinning unless drawn pixels need showing
+                if self._stdin_ready(0 if self._dirty else IDLE_POLL_MS):
                     last_comm.reset()
                     # enter tethered mode
 
                     # init for tethered mode if switching mode
                     if not self._tethered:
                         self._tethered = True
+                        self.untethered_handler.wake()
                         self.clear_display()
 
                     # handle tethered mode
                     self._tethered_mode_handle()
 
+                elif self._dirty:
+                    # serial drained without a flush, show drawn pixels once
+                    self.commit()
+
                 elif last_comm.elapsed_ms > TIMEOUT:
                     # enter untethered mode
 
@@ -211,7 +272,7 @@ class PicoGraphicsDevice:
                         self._tethered = False
                         self.clear_display()
                         self.untethered_handler.reset()
-                        self.untethered_handler.sleep = False
+                        self.untethered_handler.wake()
                         self.untethered_handler.inactivity_timer.reset()
 
                     # handle untethered mode
@@ -225,16 +286,50 @@ class PicoGraphicsDevice:
 # ! Overwrite the following methods to customise control
 # !
 
+    def draw_pixel(self, row: int, col: int, r: int, g: int, b: int) -> None:
+        """draw a pixel without updating the display, used to draw many pixels before a single update
+
+        overwrite if not the default PicoGraphics code"""
+        self.graphics.set_pen(self._pen(r, g, b))
+        self.graphics.rectangle(row * self._cell_size, col * self._cell_size,
+                                self._cell_size, self._cell_size)
+
     def set_pixel(self, row: int, col: int, r: int, g: int, b: int) -> None:
         """set a pixel on the display
 
         overwrite if not the default PicoGraphics code"""
-        self.graphics.set_pen(self.graphics.create_pen(r, g, b))
-        row, col = row * self._cell_size, col * self._cell_size
-        for i in range(self._cell_size):
-            for j in range(self._cell_size):
-                self.graphics.pixel(row+i, col+j)
-        self.graphics.update()
+        self.draw_pixel(row, col, r, g, b)
+        self.update()
+
+    def set_pixels(self, pixels: bytes) -> None:
+        """draw many pixels, the display is updated when the host sends a flush
+
+        overwrite if not the default PicoGraphics code
+
+        Args:
+            pixels: row, col, r, g, b bytes for each pixel
+        """
+        for i in range(0, len(pixels), 5):
+            self.draw_pixel(pixels[i], pixels[i+1],
+                            pixels[i+2], pixels[i+3], pixels[i+4])
+
+    def draw_run(self, row: int, col: int, length: int, r: int, g: int, b: int) -> None:
+        """draw a horizontal run of pixels with the same colour starting at row, col without updating the display
+
+        overwrite if not the default PicoGraphics code"""
+        self.graphics.set_pen(self._pen(r, g, b))
+        self.graphics.rectangle(row * self._cell_size, col * self._cell_size,
+                                length * self._cell_size, self._cell_size)
+
+    def set_runs(self, runs: bytes) -> None:
+        """draw many runs of pixels, the display is updated when the host sends a flush
+
+        Args:
+            runs: row, col, length, r, g, b bytes for each run
+        """
+        for i in range(0, len(runs), 6):
+            self.draw_run(runs[i], runs[i+1], runs[i+2],
+                          runs[i+3], runs[i+4], runs[i+5])
 
     def clear_display(self) -> None:
         """clear the display
@@ -257,6 +352,11 @@ class PicoGraphicsDevice:
         overwrite if not the default PicoGraphics code"""
         self.graphics.update()
 
+    def commit(self) -> None:
+        """show all pixels drawn since the last commit with a single update"""
+        self._dirty = False
+        self.update()
+
     def button_pressed(self) -> tuple[bool, int]:
         """overwrite this method to support changing the view using buttons
 
@@ -268,9 +368,23 @@ class PicoGraphicsDevice:
 # ! Internal Methods
 # !
 
-    def _stdin_ready(self) -> bool:
-        """return bool whether stdin has a bytes ready to be read"""
-        timeout_ms = 0
+    def _pen(self, r: int, g: int, b: int) -> int:
+        """return a pen for the colour, reusing pens for repeated colours"""
+        key = (r << 16) | (g << 8) | b
+        pen = self._pens.get(key)
+        if pen is None:
+            # bound memory use when many colours are shown
+            if len(self._pens) >= 256:
+                self._pens = {}
+            pen = self._pens[key] = self.graphics.create_pen(r, g, b)
+        return pen
+
+    def _stdin_ready(self, timeout_ms: int = 0) -> bool:
+        """return bool whether stdin has a bytes ready to be read
+
+        Args:
+            timeout_ms: time to wait for bytes [ms]. Defaults to 0.
+        """
         return bool(self._poll.poll(timeout_ms))
 
     def _send_serial(self, *args) -> None:
@@ -299,7 +413,9 @@ class PicoGraphicsDevice:
             # set pixel
             row, col, r, g, b, *_ = args
             row, col, r, g, b = int(row), int(col), int(r), int(g), int(b)
-            self.set_pixel(row, col, r, g, b)
+            # shown by a flush or once no more commands are waiting
+            self.draw_pixel(row, col, r, g, b)
+            self._dirty = True
 
         elif op == 2:
             # clear display
@@ -308,3 +424,17 @@ class PicoGraphicsDevice:
         elif op == 3:
             # request dimensions
             self._send_serial(*self.display_dimensions())
+
+        elif op == 6:
+            # set pixel batch, base64 encoded to avoid sending control characters
+            self.set_pixels(ubinascii.a2b_base64(args[0]))
+            self._dirty = True
+
+        elif op == 7:
+            # flush drawn pixels to the display
+            self.commit()
+
+        elif op == 8:
+            # set run batch, base64 encoded like the pixel batch
+            self.set_runs(ubinascii.a2b_base64(args[0]))
+            self._dirty = True
@@ -7,13 +7,12 @@ stellarunicorn = StellarUnicorn()
 
 
 class StellarUnicornDevice(PicoGraphicsDevice):
-    def set_pixel(self, row: int, col: int, r: int, g: int, b: int) -> None:
-        self.graphics.set_pen(self.graphics.create_pen(int(r), int(g), int(b)))
+    def draw_pixel(self, row: int, col: int, r: int, g: int, b: int) -> None:
+        self.graphics.set_pen(self._pen(int(r), int(g), int(b)))
         self.graphics.pixel(int(row), int(col))
-        stellarunicorn.update(self.graphics)
 
     def clear_display(self) -> None:
-        self.graphics.set_pen(self.graphics.create_pen(0, 0, 0))
+        self.graphics.set_pen(self._pen(0, 0, 0))
         self.graphics.clear()
         stellarunicorn.update(self.graphics)
 
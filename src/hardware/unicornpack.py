@@ -7,9 +7,16 @@ picounicorn = PicoUnicorn()
 
 
 class UnicornPack(PicoGraphicsDevice):
+    def draw_pixel(self, row: int, col: int, r: int, g: int, b: int) -> None:
+        picounicorn.set_pixel(row, col, r, g, b)
+
     def set_pixel(self, row: int, col: int, r: int, g: int, b: int) -> None:
         picounicorn.set_pixel(row, col, r, g, b)
 
+    def draw_run(self, row: int, col: int, length: int, r: int, g: int, b: int) -> None:
+        for i in range(length):
+            picounicorn.set_pixel(row + i, col, r, g, b)
+
     def clear_display(self) -> None:
         picounicorn.clear()
 
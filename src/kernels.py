@@ -0,0 +1,128 @@
+"""numerical kernels used in hot loops such as projecting every sat onto a matrix
+
+kernels are written as numpy array expressions, numba is optional and when installed they are JIT compiled
+"""
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """fallback when numba is not installed, kernels run as plain numpy"""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
+
+@njit(cache=True)
+def project_topocentric(alt: np.ndarray, azi: np.ndarray, x_width: float, y_width: float, width: int, height: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """project topocentric altitude and azimuth angles onto the cells of a matrix, where the top left cell is (0, 0)
+
+    Args:
+        alt: altitude angles (N,) [degrees], may include nan for invalid propogations
+        azi: azimuth angles (N,) [degrees]
+        x_width: cell width [degrees per cell]
+        y_width: cell height [degrees per cell]
+        width: number of cells in the x direction
+        height: number of cells in the y direction
+
+    Returns:
+        x (N,) int32, y (N,) int32, valid (N,) mask of sats which fall within the matrix
+    """
+    # calculate North and East Position from alt/azi, rotated by 90 degrees so North is up
+    # (sin(azi + 90) = cos(azi) and cos(azi + 90) = -sin(azi), so the angle is only converted once)
+    azi = np.radians(azi)
+    zenith_angle = 90 - alt
+    N = zenith_angle * np.cos(azi)
+    E = -zenith_angle * np.sin(azi)
+
+    # truncate towards zero to match int(), nan is moved out of the matrix before casting
+    finite = np.isfinite(N) & np.isfinite(E)
+    x = np.where(finite, E / x_width + width / 2, -1.0).astype(np.int32)
+    y = np.where(finite, N / y_width + height / 2, -1.0).astype(np.int32)
+
+    valid = (x >= 0) & (x < width) & (y >= 0) & (y < height)
+    return x, y, valid
+
+
+@njit(cache=True)
+def project_geocentric(lat: np.ndarray, lon: np.ndarray, origin_lat: float, origin_lon: float, x_width: float, y_width: float, width: int, height: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """project latitudes and longitudes onto the cells of a matrix centred on the origin, where the top left cell is (0, 0)
+
+    Args:
+        lat: latitudes (N,) [degrees], may include nan for invalid propogations
+        lon: longitudes (N,) [degrees]
+        origin_lat: latitude of the centre of the matrix [degrees]
+        origin_lon: longitude of the centre of the matrix [degrees]
+        x_width: cell width [degrees per cell]
+        y_width: cell height [degrees per cell]
+        width: number of cells in the x direction
+        height: number of cells in the y direction
+
+    Returns:
+        x (N,) int32, y (N,) int32, valid (N,) mask of sats which fall within the matrix
+    """
+    # truncate towards zero to match int(), nan is moved out of the matrix before casting
+    finite = np.isfinite(lat) & np.isfinite(lon)
+    x = np.where(finite, (lon - origin_lon) / x_width +
+                 width / 2, -1.0).astype(np.int32)
+    y = height - np.where(finite, (lat - origin_lat) / y_width +
+                          height / 2, height + 1.0).astype(np.int32)
+
+    valid = (x >= 0) & (x < width) & (y >= 0) & (y < height)
+    return x, y, valid
+
+
+@njit(cache=True)
+def itrs_to_geodetic(r: np.ndarray, radius: float, flattening: float) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """convert ITRS positions to geodetic latitude, longitude and height above an ellipsoid, such as WGS84
+
+    uses Bowring's closed form latitude instead of iterating, which is accurate to well under a metre for Earth orbits
+
+    Args:
+        r: ITRS positions (N, 3) [km], may include nan for invalid propogations
+        radius: equatorial radius of the ellipsoid [km]
+        flattening: flattening of the ellipsoid
+
+    Returns:
+        latitude (N,) [degrees], longitude (N,) [degrees], height (N,) [km]
+    """
+    x, y, z = r[:, 0], r[:, 1], r[:, 2]
+    b = radius * (1 - flattening)
+    e2 = flattening * (2 - flattening)
+    ep2 = e2 / (1 - e2)
+
+    p = np.hypot(x, y)
+    u = np.arctan2(z * radius, p * b)
+    lat = np.arctan2(z + ep2 * b * np.sin(u)**3, p - e2 * radius * np.cos(u)**3)
+
+    # height without dividing by cos(lat), so it is stable near the poles
+    sin_lat = np.sin(lat)
+    height = p * np.cos(lat) + z * sin_lat - radius * \
+        np.sqrt(1 - e2 * sin_lat**2)
+
+    return np.degrees(lat), np.degrees(np.arctan2(y, x)), height
+
+
+@njit(cache=True)
+def project_itrs_geocentric(r: np.ndarray, radius: float, flattening: float, origin_lat: float, origin_lon: float, x_width: float, y_width: float, width: int, height: int) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """project ITRS positions onto the cells of a matrix centred on the origin in a single call, combining `itrs_to_geodetic` and `project_geocentric`
+
+    Args:
+        r: ITRS positions (N, 3) [km], may include nan for invalid propogations
+        radius: equatorial radius of the ellipsoid [km]
+        flattening: flattening of the ellipsoid
+        origin_lat: latitude of the centre of the matrix [degrees]
+        origin_lon: longitude of the centre of the matrix [degrees]
+        x_width: cell width [degrees per cell]
+        y_width: cell height [degrees per cell]
+        width: number of cells in the x direction
+        height: number of cells in the y direction
+
+    Returns:
+        x (N,) int32, y (N,) int32, valid (N,) mask of sats which fall within the matrix, height above the ellipsoid (N,) [km]
+    """
+    lat, lon, alt = itrs_to_geodetic(r, radius, flattening)
+    x, y, valid = project_geocentric(
+        lat, lon, origin_lat, origin_lon, x_width, y_width, width, height)
+    return x, y, valid, alt
@@ -1,6 +1,11 @@
 """code and utilities to work with LED matrix data, generate images and more"""
+from functools import lru_cache
 from typing import TYPE_CHECKING
+import os
+import struct
+import zlib
 
+import numpy as np
 from skyfield.timelib import Time
 
 from .rgb import RGB
@@ -9,6 +14,20 @@ if TYPE_CHECKING:
     from .projectionmodels import SatFrame
 
 
+def _png_chunk(chunk_type: bytes, data: bytes) -> bytes:
+    """encode a png chunk with its length and crc"""
+    return struct.pack(">I", len(data)) + chunk_type + data + struct.pack(">I", zlib.crc32(chunk_type + data))
+
+
+@lru_cache
+def _png_header(width: int, height: int) -> bytes:
+    """png signature and IHDR chunk of an 8 bit RGB image, cached as it only depends on the size"""
+    return b"\x89PNG\r\n\x1a\n" + _png_chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+
+
+_PNG_IEND = _png_chunk(b"IEND", b"")
+
+
 class ImageFrame:
     """MatrixFrame about origin (top left) with conventional cartesian coordinates
     """
@@ -23,7 +42,7 @@ class ImageFrame:
         # ? Consider adding a self._model object
         self._matrix = matrix
         self.time = time
-        self._pixels: list[RGB] = [RGB() for _ in range(len(matrix))]
+        self._pixels = np.zeros((matrix.height, matrix.width, 3), dtype=np.uint8)
         self._sat_frame: "SatFrame" = _sat_frame  # type: ignore
         self._modifier_info = _modifier_info
 
@@ -48,19 +67,11 @@ class ImageFrame:
         """
         return int(self.unix_timestamp)
 
-    def _idx(self, x: int, y: int) -> int:
-        return (y * self._matrix.width) + x
-
     def set_pixel(self, x: int, y: int, rgb: RGB) -> None:
-        self._pixels[self._idx(x, y)] = rgb
+        self._pixels[y, x] = rgb.to_tuple()
 
     def get_pixel(self, x: int, y: int) -> RGB:
-        return self._pixels[self._idx(x, y)]
-
-    def _for_grid(self, fn) -> None:
-        for y in range(self._matrix.height):
-            for x in range(self._matrix.width):
-                fn(x, y)
+        return RGB(*self._pixels[y, x].tolist())
 
     def _print_grid(self, fn) -> None:
         """calls fn for each row and col and print output in a grid. See usage
@@ -92,19 +103,46 @@ class ImageFrame:
     def __repr__(self) -> str:
         return f"<MatrixFrame t={self.time} {self._matrix}>"
 
+    def to_numpy_rgb(self) -> np.ndarray:
+        """return the pixels of the frame without creating RGB objects, please note this is the underlying array so copy before modifying
+
+        Returns:
+            array (height, width, 3) of uint8 RGB values
+        """
+        return self._pixels
+
+    @classmethod
+    def from_rgb_array(cls, pixels: np.ndarray, time: Time | None = None) -> "ImageFrame":
+        """create a frame from an array of pixels, e.g. from `to_numpy_rgb`
+
+        Args:
+            pixels: array (height, width, 3) of uint8 RGB values
+            time: skyfield Time object. Defaults to the time of an empty frame.
+
+        Returns:
+            New ImageFrame object with a matrix the size of the array
+        """
+        if pixels.ndim != 3 or pixels.shape[2] != 3:
+            raise ValueError(
+                f"pixels must have shape (height, width, 3), not {pixels.shape}")
+
+        height, width, _ = pixels.shape
+        frame = cls(Matrix(width, height), time if time is not None else Time(ts, 0))
+        frame._pixels[:] = pixels
+        return frame
+
     def to_png(self, filename: str = "image.png") -> None:
         # TODO: Add metadata from info
-        import png
-
-        pixels = []
+        height, width, _ = self._pixels.shape
 
-        for y in range(self._matrix.height):
-            row = []
-            for x in range(self._matrix.width):
-                row.extend(self.get_pixel(x, y).to_tuple())
-            pixels.append(row)
+        # every row starts with filter type 0 (none), the images are small so filtering barely changes the file size
+        rows = np.zeros((height, 1 + 3 * width), dtype=np.uint8)
+        rows[:, 1:] = self._pixels.reshape(height, -1)
 
-        png.from_array(pixels, "RGB").save(filename)
+        # fastest compression, written directly as the header only depends on the size
+        with open(filename, "wb") as f:
+            f.write(_png_header(width, height) +
+                    _png_chunk(b"IDAT", zlib.compress(rows.tobytes(), 1)) + _PNG_IEND)
         print(f"Saved png: {filename}")
 
 
@@ -141,11 +179,8 @@ class Matrix:
 
     @path.setter
     def path(self, path) -> None:
-        import os
-
         # create directory if not exists
-        if not os.path.exists(path):
-            os.makedirs(path)
+        os.makedirs(path, exist_ok=True)
 
         self._path = path
 
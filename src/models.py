@@ -1,23 +1,82 @@
 """contains models required to proccess satellite data"""
-from typing import Callable, List, Dict, Tuple
+from typing import Callable, List, Dict, Mapping, Tuple
 from typing_extensions import Self
 
 from datetime import datetime, date
+import math
 
+import numpy as np
+from sgp4 import omm
+from sgp4.api import Satrec, SatrecArray
 from skyfield.api import EarthSatellite, load, wgs84
+from skyfield.constants import ANGVEL, DAY_S
+from skyfield.functions import mxm
 from skyfield.toposlib import GeographicPosition
-from skyfield.timelib import Time
+from skyfield.timelib import Time, compute_calendar_date
 from skyfield.framelib import itrs
+from skyfield.sgp4lib import TEME
+
+from .kernels import itrs_to_geodetic
 
 
 # Time scale for Earth Orbiting Satellites
 ts = load.timescale()
 
+# angular velocity of the ITRS frame [rad/s], used to correct velocities rotated into ITRS
+_ITRS_ANGVEL = np.array(((0.0, ANGVEL, 0.0), (-ANGVEL, 0.0, 0.0), (0.0, 0.0, 0.0)))
+
+
+def observer_enu_frame(observer: GeographicPosition) -> Tuple[np.ndarray, np.ndarray]:
+    """calculate the rotation from ITRS into the observers local East, North, Up frame
+
+    the observer is fixed to the Earth, so this doesn't change with time and can be reused for every propogation
+
+    Args:
+        observer: Topocentric observer
+
+    Returns:
+        rotation matrix (3, 3), observer position in the East, North, Up frame (3,) [km]
+    """
+    lat = observer.latitude.radians
+    lon = observer.longitude.radians
+    R_enu = np.array((
+        (-np.sin(lon), np.cos(lon), 0.0),
+        (-np.sin(lat) * np.cos(lon), -np.sin(lat) * np.sin(lon), np.cos(lat)),
+        (np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)),
+    ))
+    return R_enu, R_enu @ observer.itrs_xyz.km
+
+
+def _TEME_to_ITRS_rotations(t: Time) -> np.ndarray:
+    """rotation matrices from TEME to ITRS, (T, 3, 3) for an array of T times or (1, 3, 3) for a single time"""
+    R = mxm(itrs.rotation_at(t), np.swapaxes(TEME.rotation_at(t), 0, 1))
+    return np.moveaxis(R.reshape(3, 3, -1), 2, 0)
+
+
+def _rotate(R: np.ndarray, vectors: np.ndarray) -> np.ndarray:
+    """rotate (N, 3) or (N, T, 3) vectors by (T, 3, 3) rotation matrices, where T is 1 for (N, 3) vectors"""
+    if vectors.ndim == 2:
+        return vectors @ R[0].T
+    return np.matmul(vectors.swapaxes(0, 1), R.swapaxes(1, 2)).swapaxes(0, 1)
+
+
+def datetime_to_us(dt: datetime) -> int:
+    """microseconds since the unix epoch of a datetime, where naive datetimes are treated the same as numpy datetime64"""
+    return int(np.datetime64(dt, "us").astype(np.int64))
+
 
 class Sat:
+    __slots__ = ("tags", "_packed_tags", "satrec", "name",
+                 "_earth_satellite", "_launch_date", "_launch_us")
+
     def __init__(self, fields, group: str = "", category: str = "") -> None:
-        self.tags = [group.lower(), category.lower()]
-        self._sat = EarthSatellite.from_omm(ts, fields)
+        self.tags: set[str] = {group.lower(), category.lower()} - {""}
+        self._pack_tags()
+        # raw sgp4 model, skyfield is only used when needed
+        self.satrec = Satrec()
+        omm.initialize(self.satrec, fields)
+        self.name: str = fields.get("OBJECT_NAME")  # type: ignore
+        self._earth_satellite: EarthSatellite | None = None
         self.launch_date = None
 
     def info(self) -> str:
@@ -31,7 +90,7 @@ class Sat:
         else:
             launched = "(launched unknown)"
 
-        return f"{self.name} {launched}\n  days since epoch: {self.days_since_epoch:.2f}\n  tags: {', '.join(self.tags)}"
+        return f"{self.name} {launched}\n  days since epoch: {self.days_since_epoch:.2f}\n  tags: {', '.join(sorted(self.tags))}"
 
     def add_tag(self, tag: str) -> None:
         """add an additional tag to the sat if it doesn't already exist
@@ -42,7 +101,8 @@ class Sat:
         if tag:
             tag = tag.lower()
             if tag not in self.tags:
-                self.tags.append(tag)
+                self.tags.add(tag)
+                self._pack_tags()
 
     def add_tags(self, tags: List[str]) -> None:
         """an additional tags to the sat is they don't already exist
@@ -62,14 +122,29 @@ class Sat:
         Returns:
             bool: whether the word exists in any tag
         """
-        for tag in self.tags:
-            if word in tag:
-                return True
-        return False
+        return word in self._packed_tags
+
+    def _pack_tags(self) -> None:
+        """join tags into a single string so `in_tags` is one substring search, must be called whenever tags change"""
+        self._packed_tags = "\0" + "\0".join(self.tags) + "\0"
+
+    @property
+    def launch_date(self) -> datetime | None:
+        return self._launch_date
+
+    @launch_date.setter
+    def launch_date(self, launch_date: datetime | None) -> None:
+        self._launch_date = launch_date
+        # microseconds since the unix epoch, so comparisons are between ints
+        self._launch_us = datetime_to_us(launch_date) if launch_date else None
 
     @property
-    def name(self) -> str:
-        return self._sat.name  # type: ignore
+    def _sat(self) -> EarthSatellite:
+        """skyfield EarthSatellite for this sat, created on first use"""
+        if self._earth_satellite is None:
+            self._earth_satellite = EarthSatellite.from_satrec(self.satrec, ts)
+            self._earth_satellite.name = self.name
+        return self._earth_satellite
 
     @property
     def epoch(self):
@@ -90,7 +165,7 @@ class Sat:
         Returns:
             float: days since last update
         """
-        return ts.now() - self._sat.epoch
+        return ts.now().tt - self.epoch.tt
 
     def ICRS_position_at(self, t: Time):
         return self._sat.at(t)
@@ -126,7 +201,7 @@ class Sat:
         x_v, y_v, z_v = v.km_per_s  # type: ignore
         return x, y, z, x_v, y_v, z_v
 
-    def projected_lat_lon_alt(self, t: Time = ts.now()) -> Tuple[float, float, float]:
+    def projected_lat_lon_alt(self, t: Time | None = None) -> Tuple[float, float, float]:
         """calculate the projected latitude and longitude onto the WGS84 centeroid and the altitude above the wgs84 centeroid.
 
         This method will return bad data `(nan, nan, nan)` if the propogation is invalid. This can be checked with `math.isnan(lat)` etc.
@@ -143,21 +218,25 @@ class Sat:
             longitude [degrees],
             altitude [km]
         """
-        pos = self.ICRS_position_at(t)
-        geo_pos = wgs84.geographic_position_of(pos)
-        lat = geo_pos.latitude.degrees
-        lon = geo_pos.longitude.degrees
-        alt = geo_pos.elevation.km
+        if t is None:
+            t = ts.now()
+        d, _ = self.ITRS_position_at(t)
+        lat, lon, alt = itrs_to_geodetic(
+            np.reshape(d.km, (1, 3)), wgs84.radius.km, 1 / wgs84.inverse_flattening)
 
-        return lat, lon, alt  # type: ignore
+        return lat[0], lon[0], alt[0]
 
-    def topocentric_position_at(self, observer: GeographicPosition, t=ts.now()):
+    def topocentric_position_at(self, observer: GeographicPosition, t: Time | None = None):
+        if t is None:
+            t = ts.now()
         sat_from_topo = self._sat - observer
         return sat_from_topo.at(t)
 
-    def topocentric_alt_azimuth_distance(self, observer: GeographicPosition, t: Time = ts.now()) -> Tuple[float, float, float]:
+    def topocentric_alt_azimuth_distance(self, observer: GeographicPosition, t: Time | None = None, enu_frame: Tuple[np.ndarray, np.ndarray] | None = None) -> Tuple[float, float, float]:
         """calculate the altitude angle, azimuth angle and distance from the topocentric observer
 
+        the ITRS position is rotated into the observers local East, North, Up frame, the same as `Sats.topocentric_alt_azimuths_distances_at`
+
         Usage:
             >>> observer = wgs84.latlon(53.46, -2.233)
             >>> t = ts.now()
@@ -166,18 +245,27 @@ class Sat:
         Args:
             observer: Topocentric observer
             t: time. Defaults to ts.now().
+            enu_frame: result of `observer_enu_frame(observer)`, pass this when calling repeatedly for the same observer. Defaults to calculating it.
 
         Returns:
             altitude [degrees],
             azimuth [degrees],
             distance [km]
         """
-        pos = self.topocentric_position_at(observer, t)
-        alt, azimuth, distance = pos.altaz()
-        return alt.degrees, azimuth.degrees, distance.km  # type: ignore
+        if t is None:
+            t = ts.now()
+        R_enu, site = enu_frame if enu_frame is not None else observer_enu_frame(
+            observer)
+        d, _ = self.ITRS_position_at(t)
+        e, n, u = R_enu @ d.km - site  # type: ignore
+
+        horizontal = math.hypot(e, n)
+        alt = math.degrees(math.atan2(u, horizontal))
+        azi = math.degrees(math.atan2(e, n)) % 360.0
+        return alt, azi, math.hypot(horizontal, u)
 
     def __repr__(self) -> str:
-        return f"<Sat {self.name} ({' - '.join(self.tags)})>"
+        return f"<Sat {self.name} ({' - '.join(sorted(self.tags))})>"
 
     def generate_debris_tag(self) -> None:
         """generate a tag for this satellite if it is debris
@@ -185,7 +273,7 @@ class Sat:
         if "deb" in self.name.lower() or self.in_tags("deb"):
             self.add_tag("debris")
 
-    def add_tags_from_SATCAT(self, satcat: Dict[str, Dict]) -> None:
+    def add_tags_from_SATCAT(self, satcat: Mapping[str, Mapping[str, str]]) -> None:
         """add additional tags to the sat object if additional information exists in the SATCAT (Satellite Catologue)
 
         Args:
@@ -194,27 +282,25 @@ class Sat:
         from .datasources import SATCAT
 
         # ignore if not SATCAT data exists for sat
-        if self.name not in satcat:
+        data = satcat.get(self.name)
+        if data is None:
             return
 
-        data = satcat[self.name]
-
         # add additional tags if they exist
-        if data['OBJECT_TYPE']:
-            self.add_tag(SATCAT.OBJECT_TYPE(data["OBJECT_TYPE"]))
+        if object_type := data['OBJECT_TYPE']:
+            self.add_tag(SATCAT.OBJECT_TYPE(object_type))
 
-        if data['OPS_STATUS_CODE']:
-            self.add_tag(SATCAT.OPERATIONAL_STATUS(data['OPS_STATUS_CODE']))
+        if ops_status := data['OPS_STATUS_CODE']:
+            self.add_tag(SATCAT.OPERATIONAL_STATUS(ops_status))
 
-        if data['OWNER']:
-            self.add_tag(SATCAT.OPERATIONAL_STATUS(data['OWNER']))
+        if owner := data['OWNER']:
+            self.add_tag(SATCAT.OWNER(owner))
 
-        if data['LAUNCH_DATE']:
-            self.launch_date = datetime.strptime(
-                data['LAUNCH_DATE'], '%Y-%m-%d')
+        if launch_date := data['LAUNCH_DATE']:
+            self.launch_date = datetime.strptime(launch_date, '%Y-%m-%d')
 
-        if data['LAUNCH_SITE']:
-            self.add_tag(SATCAT.LAUNCH_SITE(data['LAUNCH_SITE']))
+        if launch_site := data['LAUNCH_SITE']:
+            self.add_tag(SATCAT.LAUNCH_SITE(launch_site))
 
 
 class Sats:
@@ -223,6 +309,7 @@ class Sats:
 
     def __init__(self, sats: List[Sat]) -> None:
         self._sats = sats
+        self._reset_cache()
 
         # filter and analyse data
         self.remove_duplicates()
@@ -239,32 +326,268 @@ class Sats:
         return self.__class__(self._sats + other._sats)
 
     def sort(self):
-        self._sats.sort(key=lambda sat: sat.name)
+        order = sorted(range(len(self._sats)),
+                       key=lambda i: self._sats[i].name)
+        self._sats = [self._sats[i] for i in order]
+        self._take_cache(self, np.array(order, dtype=np.intp))
 
     def append(self, other: Sat):
         self._sats.append(other)
+        self._reset_cache()
+
+    def _reset_cache(self) -> None:
+        """clear arrays derived from the sats, must be called whenever the sats or their tags change"""
+        self._satrec_array: SatrecArray | None = None
+        self._tag_bits: np.ndarray | None = None
+        self._tag_index: Dict[str, int] | None = None
+        self._launch_dates: np.ndarray | None = None
+        self._epochs: np.ndarray | None = None
+        self._names: np.ndarray | None = None
 
     def add_tags_from_SATCAT(self, satcat) -> None:
         """add additional tags to sats from SATCAT data"""
         for sat in self.sats:
             sat.add_tags_from_SATCAT(satcat)
+        self._reset_cache()
 
     def remove_duplicates(self):
         """removes all duplicate sats after combining tags
         """
         sats: Dict[str, Sat] = {}
         for sat in self.sats:
-            if sat.name not in sats:
-                sats[sat.name] = sat
-            else:
-                sats[sat.name].add_tags(sat.tags)
+            first = sats.setdefault(sat.name, sat)
+            if first is not sat:
+                first.add_tags(sat.tags)
 
-        self._sats = list(sats.values())
+        # the list and cached arrays are only rebuilt when duplicates were merged
+        if len(sats) != len(self._sats):
+            self._sats = list(sats.values())
+            self._reset_cache()
 
     @property
     def sats(self) -> List[Sat]:
         return self._sats
 
+    @property
+    def satrec_array(self) -> SatrecArray:
+        """SatrecArray of every sat used to propagate all sats in a single call to the sgp4 C extension
+
+        this is built on first use and reused until the sats change
+        """
+        if self._satrec_array is None:
+            self._satrec_array = SatrecArray(
+                [sat.satrec for sat in self.sats])
+        return self._satrec_array
+
+    def build_tag_index(self) -> None:
+        """build the tag bits and launch date array used to filter every sat at once without visiting each Sat
+
+        this is called automatically on first use, call again if tags are changed on individual sats
+        """
+        # give every unique tag a bit, tags are packed into as many uint64 words as needed
+        tag_index = {tag: bit for bit, tag in enumerate(
+            sorted(set().union(*(sat.tags for sat in self.sats))))}
+        rows, bits = [], []
+        for idx, sat in enumerate(self.sats):
+            for tag in sat.tags:
+                rows.append(idx)
+                bits.append(tag_index[tag])
+
+        bits = np.array(bits, dtype=np.uint64)
+        tag_bits = np.zeros((len(self.sats), (len(tag_index) + 63) // 64), dtype=np.uint64)
+        np.bitwise_or.at(tag_bits, (np.array(rows, dtype=np.intp), (bits // 64).astype(np.intp)),
+                         np.left_shift(np.uint64(1), bits % 64))
+
+        self._tag_index = tag_index
+        self._tag_bits = tag_bits
+        self._launch_dates = np.array(
+            [sat.launch_date for sat in self.sats], dtype="datetime64[s]")
+
+    @property
+    def epochs(self) -> np.ndarray:
+        """epoch of every sat as a TT julian date"""
+        if self._epochs is None and not self.sats:
+            # skyfield can't build a Time from empty calendar dates
+            self._epochs = np.empty(0)
+        elif self._epochs is None:
+            # from the julian date filled by every sgp4 version, matching EarthSatellite.from_satrec
+            jd = np.array([sat.satrec.jdsatepoch for sat in self.sats])
+            jd_fraction = np.array(
+                [sat.satrec.jdsatepochF for sat in self.sats])
+            whole, fraction = np.divmod(jd, 1.0)
+            year, month, day = compute_calendar_date(whole.astype(np.int64))
+            self._epochs = np.atleast_1d(
+                ts.utc(year, month, day + 0.5 + fraction + jd_fraction).tt)
+        return self._epochs
+
+    @property
+    def names(self) -> np.ndarray:
+        """name of every sat"""
+        if self._names is None:
+            self._names = np.array([sat.name for sat in self.sats], dtype=object)
+        return self._names
+
+    @property
+    def tag_bits(self) -> np.ndarray:
+        """tags of every sat packed as bits (N, W) uint64, see `tag_index` for the bit of each tag"""
+        if self._tag_bits is None:
+            self.build_tag_index()
+        return self._tag_bits  # type: ignore
+
+    @property
+    def tag_index(self) -> Dict[str, int]:
+        """bit used for each tag in `tag_bits`"""
+        if self._tag_index is None:
+            self.build_tag_index()
+        return self._tag_index  # type: ignore
+
+    @property
+    def tag_masks(self) -> Dict[str, np.ndarray]:
+        """boolean mask of which sats include each tag, unpacked from `tag_bits`"""
+        return {tag: self.tag_mask([tag]) for tag in self.tag_index}
+
+    @property
+    def launch_dates(self) -> np.ndarray:
+        """launch date of every sat as datetime64, `NaT` where the launch date is unknown"""
+        if self._launch_dates is None:
+            self.build_tag_index()
+        return self._launch_dates  # type: ignore
+
+    def tag_mask(self, tags: List[str], indices: np.ndarray | None = None) -> np.ndarray:
+        """returns a boolean mask of the sats which include any of the tags
+
+        Args:
+            tags: list of lowercase tags
+            indices: only check the sats at these indices. Defaults to every sat.
+
+        Returns:
+            boolean array with an element per sat, or per index
+        """
+        # a single AND over the packed bits, for any number of tags
+        query = np.zeros(self.tag_bits.shape[1], dtype=np.uint64)
+        for tag in tags:
+            if tag in self.tag_index:
+                bit = self.tag_index[tag]
+                query[bit // 64] |= np.uint64(1) << np.uint64(bit % 64)
+
+        tag_bits = self.tag_bits if indices is None else self.tag_bits[indices]
+        if not query.any():
+            return np.zeros(len(tag_bits), dtype=bool)
+        return (tag_bits & query).any(axis=1)
+
+    def TEME_positions_and_velocities_at(self, t: Time) -> Tuple[np.ndarray, np.ndarray]:
+        """propagate all sats to the given time relative to the TEME reference frame used by SGP4
+
+        invalid propagations are returned as `nan` for that sat
+
+        Args:
+            t: time to propogate to, or an array of T times to propogate every sat to every time in a single call
+
+        Returns:
+            positions (N, 3) [km], velocities (N, 3) [km/s], or (N, T, 3) for an array of times
+        """
+        # sgp4 expects UTC julian dates, matching EarthSatellite
+        jd = np.atleast_1d(t.whole)
+        fr = np.atleast_1d(t.tai_fraction - t._leap_seconds() / DAY_S)
+
+        e, r, v = self.satrec_array.sgp4(jd, fr)
+        r[e != 0] = np.nan
+        v[e != 0] = np.nan
+
+        if t.shape == ():
+            return r[:, 0], v[:, 0]
+        return r, v
+
+    def ITRS_positions_and_velocities_at(self, t: Time) -> Tuple[np.ndarray, np.ndarray]:
+        """propagate all sats to the given time relative to the ITRS ECEF Geocentric reference frame
+
+        this is equivalent to calling `Sat.ITRS_cartesian_position_and_velocity_at` for each sat, but rotates every sat at once
+
+        Args:
+            t: time to propogate to, or an array of T times
+
+        Returns:
+            positions (N, 3) [km], velocities (N, 3) [km/s], or (N, T, 3) for an array of times
+        """
+        r, v = self.TEME_positions_and_velocities_at(t)
+
+        # rotate TEME -> GCRS -> ITRS in a single matrix per time
+        R = _TEME_to_ITRS_rotations(t)
+        r = _rotate(R, r)
+        v = _rotate(R, v) + r @ _ITRS_ANGVEL.T
+
+        return r, v
+
+    def ITRS_positions_at(self, t: Time) -> np.ndarray:
+        """propagate all sats to the given time relative to the ITRS ECEF Geocentric reference frame, without rotating the velocities
+
+        Args:
+            t: time to propogate to, or an array of T times
+
+        Returns:
+            positions (N, 3) [km], or (N, T, 3) for an array of times
+        """
+        r, _ = self.TEME_positions_and_velocities_at(t)
+        return _rotate(_TEME_to_ITRS_rotations(t), r)
+
+    def ITRS_cartesian_positions_and_velocities_at(self, t: Time) -> np.ndarray:
+        """returns the position and veloicty of every sat progated to the given time, relative to the ITRS ECEF Geocentric reference frame where units are km or km/s respectively
+
+        Args:
+            t: time to propogate to
+
+        Returns:
+            array (N, 6) with rows of x, y, z [km], x_v, y_v, z_v [km/s]
+        """
+        return np.hstack(self.ITRS_positions_and_velocities_at(t))
+
+    def projected_lats_lons_alts_at(self, t: Time) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """calculate the projected latitude and longitude onto the WGS84 centeroid and the altitude above the wgs84 centeroid of every sat
+
+        this is equivalent to calling `Sat.projected_lat_lon_alt` for each sat, but propogates and converts every sat at once
+
+        Args:
+            t: time to propogate to
+
+        Returns:
+            latitude (N,) [degrees],
+            longitude (N,) [degrees],
+            altitude (N,) [km], all `nan` where the propogation is invalid
+        """
+        return itrs_to_geodetic(self.ITRS_positions_at(t), wgs84.radius.km, 1 / wgs84.inverse_flattening)
+
+    def topocentric_alt_azimuths_distances_at(self, observer: GeographicPosition, t: Time, enu_frame: Tuple[np.ndarray, np.ndarray] | None = None, dtype: type = np.float64) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """calculate the altitude angle, azimuth angle and distance of every sat from the topocentric observer
+
+        this is equivalent to calling `Sat.topocentric_alt_azimuth_distance` for each sat, the relative position is rotated into the observers local East, North, Up frame for all sats at once
+
+        Args:
+            observer: Topocentric observer
+            t: time to propogate to, or an array of T times
+            enu_frame: result of `observer_enu_frame(observer)`, pass this when calling repeatedly for the same observer. Defaults to calculating it.
+            dtype: float type used after propogation, float32 is precise to around a metre and halves memory use. Defaults to np.float64.
+
+        Returns:
+            altitude (N,) [degrees],
+            azimuth (N,) [degrees],
+            distance (N,) [km], all `nan` where the propogation is invalid or (N, T) for an array of times
+        """
+        R_enu, site = enu_frame if enu_frame is not None else observer_enu_frame(
+            observer)
+        r, _ = self.TEME_positions_and_velocities_at(t)
+
+        # rotate TEME -> GCRS -> ITRS -> ENU in a single matrix per time
+        R = R_enu @ _TEME_to_ITRS_rotations(t)
+        enu = (_rotate(R, r) - site).astype(dtype, copy=False)
+        e, n, u = enu[..., 0], enu[..., 1], enu[..., 2]
+
+        horizontal = np.hypot(e, n)
+        alt = np.degrees(np.arctan2(u, horizontal))
+        azi = np.degrees(np.arctan2(e, n)) % 360.0
+        distance = np.hypot(horizontal, u)
+
+        return alt, azi, distance
+
     def limit(self, n: int) -> Self:
         """returns a new Sats object containing the first n sats
 
@@ -274,7 +597,35 @@ class Sats:
         Returns:
             new Sats object
         """
-        return self.__class__(self.sats[:n])
+        mask = np.zeros(len(self), dtype=bool)
+        mask[:n] = True
+        return self._from_mask(mask)
+
+    def _from_mask(self, mask: np.ndarray) -> Self:
+        """returns a new Sats object containing the sats in the boolean mask
+
+        the sats are already processed so this skips `__init__` and slices any arrays that have already been built instead of rebuilding them
+        """
+        idx = np.flatnonzero(mask)
+        new = self.__class__.__new__(self.__class__)
+        new._sats = [self._sats[i] for i in idx.tolist()]
+        new._take_cache(self, idx)
+        return new
+
+    def _take_cache(self, source: "Sats", idx: np.ndarray) -> None:
+        """replace the cached arrays with those already built for source, taken at idx, source may be this object"""
+        tag_bits, tag_index, launch_dates = source._tag_bits, source._tag_index, source._launch_dates
+        epochs, names = source._epochs, source._names
+        self._reset_cache()
+
+        if tag_bits is not None:
+            self._tag_bits = tag_bits[idx]
+            self._tag_index = tag_index
+            self._launch_dates = launch_dates[idx]  # type: ignore
+        if epochs is not None:
+            self._epochs = epochs[idx]
+        if names is not None:
+            self._names = names[idx]
 
     def filter(self, fn: Callable[[Sat], bool]) -> Self:
         """returns a new Sats object containing all sats for which fn(sat) is true
@@ -290,7 +641,7 @@ class Sats:
         Returns:
             new Sats object
         """
-        return self.__class__([sat for sat in self.sats if fn(sat)])
+        return self._from_mask(np.fromiter((fn(sat) for sat in self.sats), dtype=bool, count=len(self)))
 
     def filter_old(self, age_days: float = 14.0) -> Self:
         """filter out data from sats older than age_days
@@ -301,36 +652,43 @@ class Sats:
         Returns:
             new Sats object
         """
-        return self.filter(lambda sat: sat.days_since_epoch < age_days)
+        return self._from_mask((ts.now().tt - self.epochs) < age_days)
+
+    def in_tags(self, word: str) -> np.ndarray:
+        """mask of sats where the word is included in any of their tags, see `Sat.in_tags`
+
+        Args:
+            word: search word
+
+        Returns:
+            boolean mask with an element per sat
+        """
+        # only the unique tags are searched, rather than the tags of every sat
+        return self.tag_mask([tag for tag in self.tag_index if word in tag])
 
     def filter_only_debris(self) -> Self:
-        return self.filter(lambda sat: "debris" in sat.tags)
+        return self._from_mask(self.tag_mask(["debris"]))
 
     def filter_no_debris(self) -> Self:
-        return self.filter(lambda sat: not "debris" in sat.tags)
+        return self._from_mask(~self.tag_mask(["debris"]))
 
     def print_all_tags(self) -> None:
-        tags = {}
-        # generate unique dict of all tags
-        for sat in self.sats:
-            for tag in sat.tags:
-                tags[tag] = True
-
-        tags = list(tags.keys())
-        tags.sort()
-        for tag in tags:
+        for tag in sorted(set().union(*(sat.tags for sat in self.sats))):
             print(tag, end=", ")
 
 
 class SatPosition:
     """Represents a satellite at an instantaneous time and it's location within a model"""
+    __slots__ = ("sat", "x", "y", "altitude", "distance", "index")
 
-    def __init__(self, sat: Sat, x: int, y: int, *, altiude: float = -1, distance: float = -1):
+    def __init__(self, sat: Sat, x: int, y: int, *, altiude: float = -1, distance: float = -1, index: int = -1):
         self.sat = sat
         self.x = x
         self.y = y
         self.altitude = altiude
         self.distance = distance
+        self.index = index
+        """index of the sat within the Sats of the model, -1 if unknown"""
 
     def info(self) -> str:
         addon = ""
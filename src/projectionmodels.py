@@ -1,14 +1,18 @@
 """contains grids for projecting satellite locations onto rectangular grids"""
+from typing import Iterator
 from typing_extensions import Self, Sequence
 
 import math
 
+import numpy as np
+from skyfield.api import wgs84
 from skyfield.toposlib import GeographicPosition
 from skyfield.timelib import Time
 
-from .models import Sats, SatPosition
+from .models import Sats, SatPosition, observer_enu_frame
 from .matrix import Matrix, ImageFrame
 from .analysis import BasePixelModifier
+from .kernels import project_itrs_geocentric, project_topocentric
 
 EARTH_RADIUS = 6371  # [km] mean radius
 
@@ -21,10 +25,45 @@ class SatFrame:
     sat frames can be used for analysis in place or for generating ImageFrame using the `render` method
     """
 
-    def __init__(self, model: "BaseProjectionModel", time: Time, sats: list[SatPosition] = []) -> None:
+    def __init__(self, model: "BaseProjectionModel", time: Time, sats: list[SatPosition] | None = None) -> None:
         self.model = model
-        self._sats = sats
+        self._sats = sats if sats is not None else []
         self.time = time
+        self._reset_cache()
+
+    @classmethod
+    def from_arrays(cls, model: "BaseProjectionModel", time: Time, indices: np.ndarray, xs: np.ndarray, ys: np.ndarray, altitude_km: np.ndarray | None = None, distance_km: np.ndarray | None = None) -> Self:
+        """create a SatFrame from projected sats, reusing the arrays for rendering instead of rebuilding them from each SatPosition
+
+        Args:
+            model: model the sats were projected with
+            time: propogation time
+            indices: index of each sat within the Sats of the model (N,)
+            xs: x position of each sat (N,)
+            ys: y position of each sat (N,)
+            altitude_km: altitude of each sat [km] (N,). Defaults to None.
+            distance_km: distance of each sat from the observer [km] (N,). Defaults to None.
+
+        Returns:
+            New SatFrame object
+        """
+        all_sats = model._sats.sats
+        n = len(indices)
+        altitudes = altitude_km.tolist() if altitude_km is not None else [-1] * n
+        distances = distance_km.tolist() if distance_km is not None else [-1] * n
+        sats = [
+            SatPosition(all_sats[i], x, y, altiude=a, distance=d, index=i)
+            for i, x, y, a, d in zip(indices.tolist(), xs.tolist(), ys.tolist(), altitudes, distances)
+        ]
+
+        frame = cls(model, time, sats)
+        frame._indices = indices.astype(np.intp)
+        frame._pixel_indices = ys.astype(np.intp) * model.width + xs
+        if altitude_km is not None:
+            frame._altitude_km = altitude_km.astype(float)
+        if distance_km is not None:
+            frame._distance_km = distance_km.astype(float)
+        return frame
 
     @property
     def sats(self) -> list[SatPosition]:
@@ -32,6 +71,64 @@ class SatFrame:
 
     def add_sat(self, sat: SatPosition) -> None:
         self._sats.append(sat)
+        self._reset_cache()
+
+    def _reset_cache(self) -> None:
+        """clear arrays derived from the sats in this frame, these are reused when rendering the frame multiple times"""
+        self._indices: np.ndarray | None = None
+        self._pixel_indices: np.ndarray | None = None
+        self._tag_masks: dict[frozenset[str], np.ndarray] = {}
+        self._altitude_km: np.ndarray | None = None
+        self._distance_km: np.ndarray | None = None
+
+    @property
+    def indices(self) -> np.ndarray:
+        """index of each sat in this frame within the Sats of the model, -1 if unknown"""
+        if self._indices is None:
+            self._indices = np.array(
+                [sat.index for sat in self.sats], dtype=np.intp)
+        return self._indices
+
+    @property
+    def pixel_indices(self) -> np.ndarray:
+        """flat pixel index of each sat in this frame, (y * width) + x"""
+        if self._pixel_indices is None:
+            xs = np.array([sat.x for sat in self.sats], dtype=np.intp)
+            ys = np.array([sat.y for sat in self.sats], dtype=np.intp)
+            self._pixel_indices = ys * self.model.width + xs
+        return self._pixel_indices
+
+    @property
+    def altitude_km(self) -> np.ndarray:
+        """altitude of each sat in this frame [km], -1 if not supported by the model"""
+        if self._altitude_km is None:
+            self._altitude_km = np.array(
+                [sat.altitude for sat in self.sats], dtype=float)
+        return self._altitude_km
+
+    @property
+    def distance_km(self) -> np.ndarray:
+        """distance of each sat in this frame from the observer [km], -1 if not supported by the model"""
+        if self._distance_km is None:
+            self._distance_km = np.array(
+                [sat.distance for sat in self.sats], dtype=float)
+        return self._distance_km
+
+    def tag_mask(self, tags: list[str]) -> np.ndarray:
+        """boolean mask of which sats in this frame include any of the tags, cached for the frame
+
+        Args:
+            tags: list of lowercase tags
+
+        Returns:
+            boolean array with an element per sat in the frame
+        """
+        key = frozenset(tags)
+        if key not in self._tag_masks:
+            # only the sats in this frame are checked
+            self._tag_masks[key] = self.model._sats.tag_mask(
+                tags, self.indices)
+        return self._tag_masks[key]
 
     @property
     def unix_timestamp(self) -> float:
@@ -56,6 +153,11 @@ class SatFrame:
         """number of cells"""
         return len(self.model._matrix)
 
+    @property
+    def cell_counts(self) -> np.ndarray:
+        """number of sats in each cell (height, width)"""
+        return np.bincount(self.pixel_indices, minlength=self.cells).reshape(self.model.height, self.model.width)
+
     @property
     def density(self) -> float:
         """average cell density"""
@@ -86,18 +188,63 @@ class SatFrame:
         modifier_str = "Key\n  " + \
             "\n  ".join([modifier.info() for modifier in modifiers])
 
+        # evaluate modifiers that support masks for every sat in the frame at once
+        if np.any(self.indices < 0):
+            masks = [None] * len(modifiers)
+        else:
+            masks = [modifier.mask(self) if modifier._uses_mask else None
+                     for modifier in modifiers]
+
+        if all(mask is not None for mask in masks):
+            modifier_rgb = np.array(
+                [modifier._rgb_vec for modifier in modifiers], dtype=np.int16).reshape(-1, 3)
+            modifier_masks = np.array(masks, dtype=bool).reshape(
+                len(modifiers), self.number_of_sats)
+            return self.render_fast(modifier_rgb, modifier_masks, modifier_str)
+
         # create new image frame
         frame = ImageFrame(self.model._matrix, self.time,
                            _sat_frame=self, _modifier_info=modifier_str)
 
-        # render frame
-        for sat in self.sats:
+        # render frame one sat at a time when modifiers don't support masks
+        for i, sat in enumerate(self.sats):
             rgb = frame.get_pixel(sat.x, sat.y)
-            for modifier in modifiers:
-                rgb = modifier.handle(sat, rgb)
+            for modifier, mask in zip(modifiers, masks):
+                if mask is None:
+                    rgb = modifier.handle(sat, rgb)
+                elif mask[i]:
+                    rgb += modifier.modifier  # type: ignore
             frame.set_pixel(sat.x, sat.y, rgb)
         return frame
 
+    def render_fast(self, modifier_rgb: np.ndarray, modifier_masks: np.ndarray, modifier_info: str = "") -> ImageFrame:
+        """render a new ImageFrame object from precomputed modifier colours and masks without using the modifier objects
+
+        this is used by `render` and is useful when rendering the same frame many times, as the sat positions are reused
+
+        Args:
+            modifier_rgb: colour added by each of the M modifiers (M, 3)
+            modifier_masks: boolean mask of which of the N sats in this frame each modifier applies to (M, N)
+            modifier_info: key included in the ImageFrame info. Defaults to "".
+
+        Returns:
+            New ImageFrame object
+        """
+        frame = ImageFrame(self.model._matrix, self.time,
+                           _sat_frame=self, _modifier_info=modifier_info)
+
+        # count the sats each modifier applies to in every cell, then colour every cell with a single matmul
+        # (counts are exact in float64, and bincount is much faster than np.add.at)
+        counts = np.zeros((len(modifier_rgb), self.cells))
+        for i, mask in enumerate(modifier_masks):
+            counts[i] = np.bincount(
+                self.pixel_indices, weights=mask, minlength=self.cells)
+        buf = counts.T @ modifier_rgb.astype(np.float64)
+
+        # modifiers only add colour, so clamping once matches clamping after each modifier
+        frame._pixels[:] = np.clip(buf, 0, 255).reshape(frame._pixels.shape)
+        return frame
+
 
 class BaseProjectionModel:
     name: str
@@ -116,10 +263,24 @@ class BaseProjectionModel:
         """
         self._matrix = matrix
         self._sats = sats
+        # build the sgp4 array once up front, so it is shared by every frame rather than built during the first
+        sats.satrec_array
         self.origin = observer
         self.x_width = x_width
         self.y_width = y_width
 
+    @property
+    def origin(self) -> GeographicPosition:
+        return self._origin
+
+    @origin.setter
+    def origin(self, observer: GeographicPosition) -> None:
+        self._origin = observer
+        # origin is fixed to the Earth so its angles and local frame only need calculating once
+        self._origin_lat = observer.latitude.degrees
+        self._origin_lon = observer.longitude.degrees
+        self._enu_frame = observer_enu_frame(observer)
+
     @classmethod
     def from_FoV(cls, matrix: Matrix, sats: Sats, observer: GeographicPosition, FoV: float) -> Self:
         """create a new projection model
@@ -139,6 +300,45 @@ class BaseProjectionModel:
     def generate_sat_frame(self, t: Time) -> SatFrame:
         raise NotImplementedError()
 
+    def sat_indices_at(self, t: Time) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """project every sat onto the matrix at the given time without creating a SatFrame, useful when only the cells are needed
+
+        Args:
+            t: propogation time
+
+        Returns:
+            x (N,) int32, y (N,) int32, valid (N,) mask of sats which fall within the matrix, with an element per sat in the Sats of the model
+        """
+        raise NotImplementedError()
+
+    def cell_counts_at(self, t: Time) -> np.ndarray:
+        """number of sats in each cell at the given time, without creating a SatFrame
+
+        Args:
+            t: propogation time
+
+        Returns:
+            counts (height, width)
+        """
+        xs, ys, valid = self.sat_indices_at(t)
+        return np.bincount(ys[valid] * self.width + xs[valid], minlength=len(self._matrix)).reshape(self.height, self.width)
+
+    def generate_sat_frames(self, times: Time) -> Iterator[SatFrame]:
+        """generate a SatFrame for each time in an array of times, see `generate_sat_frame`
+
+        Usage:
+            >>> times = t_start + np.arange(60) / DAY_S  # every second for a minute
+            >>> for sat_frame in model.generate_sat_frames(times):
+
+        Args:
+            times: array of propogation times
+
+        Yields:
+            SatFrame in the same order as times
+        """
+        for i in range(len(times)):
+            yield self.generate_sat_frame(times[i])
+
     def info(self) -> str:
         raise NotImplementedError()
 
@@ -178,30 +378,53 @@ class GeocentricProjectionModel(BaseProjectionModel):
         Args:
             t: Time propogation time for sat.
         """
-        frame = SatFrame(self, t)
+        return self._sat_frame_from_ITRS_positions(t, self._sats.ITRS_positions_at(t))
 
-        for sat in self._sats.sats:
-            # propogate
-            lat, lon, alt = sat.projected_lat_lon_alt(t)
+    def generate_sat_frames(self, times: Time, chunk_size: int = 60) -> Iterator[SatFrame]:
+        """generate a SatFrame for each time in an array of times, see `generate_sat_frame`
 
-            # ignore when propogation is invalid
-            if math.isnan(lat) or math.isnan(lon) or math.isnan(alt):
-                continue
+        every sat is propogated to many times in a single call, which is much faster than propogating each time separately
 
-            # calculate idx within frame of sat
-            x = int((lon - self.origin.longitude.degrees) /
-                    self.x_width + self.width/2)
-            if x < 0 or x >= self.width:
-                continue
+        Usage:
+            >>> times = t_start + np.arange(60) / DAY_S  # every second for a minute
+            >>> for sat_frame in model.generate_sat_frames(times):
 
-            y = self.height - int((lat - self.origin.latitude.degrees) /
-                                  self.y_width + self.height/2)
-            if y < 0 or y >= self.height:
-                continue
+        Args:
+            times: array of propogation times
+            chunk_size: number of times propogated per call, limits memory use. Defaults to 60.
 
-            frame.add_sat(SatPosition(sat, x, y, altiude=alt))
+        Yields:
+            SatFrame in the same order as times
+        """
+        for start in range(0, len(times), chunk_size):
+            chunk = times[start:start + chunk_size]
+            r = self._sats.ITRS_positions_at(chunk)
 
-        return frame
+            for i in range(len(chunk)):
+                # contiguous positions per time for the projection kernel
+                yield self._sat_frame_from_ITRS_positions(chunk[i], np.ascontiguousarray(r[:, i]))
+
+    def _sat_frame_from_ITRS_positions(self, t: Time, r: np.ndarray) -> SatFrame:
+        """project every sat onto the grid from its ITRS position (N, 3) [km] and return a SatFrame of the sats within the grid"""
+        xs, ys, valid, alt = self._project_ITRS_positions(r)
+        idx = np.flatnonzero(valid)
+
+        return SatFrame.from_arrays(self, t, idx, xs[idx], ys[idx], altitude_km=alt[idx])
+
+    def sat_indices_at(self, t: Time) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        xs, ys, valid, _ = self._project(t)
+        return xs, ys, valid
+
+    def _project(self, t: Time) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """propogate every sat and project it onto the matrix, returning x, y, valid and altitude [km] for every sat"""
+        # propogate every sat at once
+        return self._project_ITRS_positions(self._sats.ITRS_positions_at(t))
+
+    def _project_ITRS_positions(self, r: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """project ITRS positions (N, 3) [km] onto the matrix, returning x, y, valid and altitude [km] for every sat"""
+        # calculate idx of each sat within the frame, straight from the ITRS positions
+        return project_itrs_geocentric(
+            r, wgs84.radius.km, 1 / wgs84.inverse_flattening, self._origin_lat, self._origin_lon, self.x_width, self.y_width, self.width, self.height)
 
     @classmethod
     def _cell_width_and_height_from_FoV(cls, matrix: Matrix, FoV: float) -> tuple[float, float]:
@@ -323,43 +546,62 @@ class TopocentricProjectionModel(BaseProjectionModel):
             t: propogation time for sat.
         """
 
-        sats: list[SatPosition] = []
+        # propogate every sat at once
+        # float32 is plenty for projecting onto cells and halves the memory used per sat
+        alt, azi, distance = self._sats.topocentric_alt_azimuths_distances_at(
+            self.origin, t, self._enu_frame, dtype=np.float32)
 
-        for sat in self._sats.sats:
-            # propogate
-            alt, azi, distance = sat.topocentric_alt_azimuth_distance(
-                self.origin, t)
+        return self._sat_frame_from_alt_azimuths_distances(t, alt, azi, distance)
 
-            # ignore when propogation is invalid
-            if math.isnan(alt) or math.isnan(azi) or math.isnan(distance):
-                continue
+    def sat_indices_at(self, t: Time) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        alt, azi, _ = self._sats.topocentric_alt_azimuths_distances_at(
+            self.origin, t, self._enu_frame, dtype=np.float32)
+        return project_topocentric(alt, azi, self.x_width, self.y_width, self.width, self.height)
 
-            # Tinker with azimuth so North is up
-            azi += 90
+    def generate_sat_frames(self, times: Time, chunk_size: int = 60) -> Iterator[SatFrame]:
+        """generate a SatFrame for each time in an array of times, see `generate_sat_frame`
 
-            # calculate North and East Position from alt/azi
-            N = (90 - alt) * math.sin(math.radians(azi))  # N
-            E = (90 - alt) * math.cos(math.radians(azi))  # E
+        every sat is propogated to many times in a single call, which is much faster than propogating each time separately
 
-            # calculate idx of sat
-            x = int(E/self.x_width + self.width/2)
-            if x < 0 or x >= self.width:
-                continue
+        Usage:
+            >>> times = t_start + np.arange(60) / DAY_S  # every second for a minute
+            >>> for sat_frame in model.generate_sat_frames(times):
 
-            y = int(N/self.y_width + self.height/2)
-            if y < 0 or y >= self.height:
-                continue
-
-            # calculate altitude (distance) [km]
-            alt_distance = math.sqrt(
-                distance**2 + EARTH_RADIUS**2 - 2 * distance *
-                EARTH_RADIUS * math.cos(math.radians(alt + 90))
-            ) - EARTH_RADIUS
-
-            sats.append(SatPosition(
-                sat, x, y, altiude=alt_distance, distance=distance))
+        Args:
+            times: array of propogation times
+            chunk_size: number of times propogated per call, limits memory use. Defaults to 60.
 
-        return SatFrame(self, t, sats)
+        Yields:
+            SatFrame in the same order as times
+        """
+        for start in range(0, len(times), chunk_size):
+            chunk = times[start:start + chunk_size]
+            alt, azi, distance = self._sats.topocentric_alt_azimuths_distances_at(
+                self.origin, chunk, self._enu_frame, dtype=np.float32)
+
+            # contiguous rows per time for the projection kernel
+            alt, azi, distance = np.ascontiguousarray(alt.T), np.ascontiguousarray(
+                azi.T), np.ascontiguousarray(distance.T)
+
+            for i in range(len(chunk)):
+                yield self._sat_frame_from_alt_azimuths_distances(
+                    chunk[i], alt[i], azi[i], distance[i])
+
+    def _sat_frame_from_alt_azimuths_distances(self, t: Time, alt: np.ndarray, azi: np.ndarray, distance: np.ndarray) -> SatFrame:
+        """project every sat onto the grid from its topocentric altitude, azimuth [degrees] and distance [km] and return a SatFrame of the sats within the grid"""
+        # calculate idx of each sat within the frame
+        xs, ys, valid = project_topocentric(
+            alt, azi, self.x_width, self.y_width, self.width, self.height)
+        idx = np.flatnonzero(valid)
+
+        # calculate altitude (distance) [km]
+        # cos(alt + 90) = -sin(alt)
+        alt_distance = np.sqrt(
+            distance[idx]**2 + EARTH_RADIUS**2 + 2 * distance[idx] *
+            EARTH_RADIUS * np.sin(np.radians(alt[idx]))
+        ) - EARTH_RADIUS
+
+        return SatFrame.from_arrays(self, t, idx, xs[idx], ys[idx], altitude_km=alt_distance, distance_km=distance[idx])
 
     def minimum_FoV(self) -> float:
         """minimimum FoV from the observers locations
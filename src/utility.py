@@ -3,10 +3,15 @@ from skyfield.api import utc
 from time import monotonic
 from pathlib import Path
 from typing import Literal
+from typing_extensions import Self
 
 from skyfield.toposlib import GeographicPosition
 from skyfield.api import wgs84
-from .projectionmodels import BaseProjectionModel
+from skyfield.constants import DAY_S
+import numpy as np
+from .projectionmodels import BaseProjectionModel, SatFrame
+from .analysis import BasePixelModifier
+from concurrent.futures import ThreadPoolExecutor
 from src import *
 import datetime
 
@@ -113,6 +118,60 @@ def png_to_gif(png_path: str, gif_filename: str = "./images/out.gif", duration_m
     iio.imwrite(gif_filename, frames, duration=duration_ms, loop=0)
 
 
+def render_and_save_png(sat_frame: SatFrame, modifiers: list[BasePixelModifier], filename: str) -> None:
+    """render the sat frame with the modifiers and save it as a png, used to render several views of a frame in parallel
+
+    Args:
+        sat_frame: SatFrame to render
+        modifiers: list of modifiers to apply to sats
+        filename: output png filename
+    """
+    sat_frame.render(modifiers).to_png(filename)
+
+
+class GifWriter:
+    """streams ImageFrames into an animated gif as they are rendered, without saving and reloading a png per frame
+
+    Usage:
+        >>> with GifWriter("./images/out.gif", duration_ms=200) as writer:
+        >>>     writer.append(image_frame)
+    """
+
+    def __init__(self, gif_filename: str = "./images/out.gif", duration_ms: int = 1000, loop: int = 0) -> None:
+        """open a new gif for writing
+
+        Args:
+            gif_filename: output filename. Defaults to "./images/out.gif".
+            duration_ms: duration of each frame [ms]. Defaults to 1000.
+            loop: number of times to loop, 0 loops forever. Defaults to 0.
+        """
+        import imageio.v3 as iio
+
+        Path(gif_filename).parent.mkdir(parents=True, exist_ok=True)
+        self._file = iio.imopen(gif_filename, "w", extension=".gif")
+        self.duration_ms = duration_ms
+        self.loop = loop
+
+    def append(self, frame: ImageFrame) -> None:
+        """append a frame to the end of the gif
+
+        Args:
+            frame: ImageFrame to append
+        """
+        self._file.write(frame.to_numpy_rgb(),
+                         duration=self.duration_ms, loop=self.loop)
+
+    def close(self) -> None:
+        """finish writing the gif"""
+        self._file.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
 def create_backup_images() -> None:
     """generates backup data for the next 60 seconds and sends to the device
     """
@@ -186,26 +245,31 @@ def create_backup_images() -> None:
 
     # set time
     t_start = ts.from_datetime(start_time)
-    t_end = ts.from_datetime(end_time)
-    t = t_start
+    times = t_start + np.arange(0, (end_time - start_time).total_seconds()) / DAY_S
 
     timer = LapTimer()
 
-    while t < t_end:
-        # propogate sat positions
-        sat_frame = model.generate_sat_frame(t)
+    # views of each frame are rendered and saved in parallel while the next frame is propogated
+    pending = []
+    with ThreadPoolExecutor(max_workers=len(modifiers)) as executor:
+        # propogate sat positions for every second at once
+        for sat_frame in model.generate_sat_frames(times):
+            # wait for the previous frame to be saved, raising any errors
+            for future in pending:
+                future.result()
 
-        # generate image frame for each modifier and save
-        for idx, modifer in enumerate(modifiers):
-            path = f"{SRC_DIR}/{width}x{height}/{idx}/{sat_frame.unix_timestamp_seconds}.png"
-            frame = sat_frame.render(modifer)
-            frame.to_png(path)
+            # generate image frame for each modifier and save
+            pending = [
+                executor.submit(render_and_save_png, sat_frame, modifer,
+                                f"{SRC_DIR}/{width}x{height}/{idx}/{sat_frame.unix_timestamp_seconds}.png")
+                for idx, modifer in enumerate(modifiers)
+            ]
 
-        # increment propogation time
-        t += datetime.timedelta(seconds=1)
+            timer.lap()
+            print(timer.info() + " "*20, end="\r")
 
-        timer.lap()
-        print(timer.info() + " "*20, end="\r")
+        for future in pending:
+            future.result()
 
     print("Generated all frames")
     print("Starting upload to device")
@@ -217,24 +281,35 @@ def create_backup_images() -> None:
     print("Upload complete")
 
 
-def reset_device(device: Literal["displaypack", "stellarunicorn", "unicornpack", "displaypack2.8"]) -> None:
+def reset_device(device: Literal["displaypack", "stellarunicorn", "unicornpack", "displaypack2.8"], precompile: bool = False) -> None:
     """regenerated filesystem structure and copy code
 
-    does not delete any data or images but will overwrite code files"""
+    does not delete any data or images but will overwrite code files
+
+    Args:
+        device: device type
+        precompile: precompile the core code with mpy-cross, see `RemoteInterface.put_module`. Defaults to False.
+    """
     remote = RemoteInterface()
-    remote.put("./src/hardware/core.py", "core.py")
+    remote.put_module("./src/hardware/core.py", "core.py", precompile)
     remote.put(f"./src/hardware/{device}.py", "main.py")
     remote._create_dir_if_not_exist("images")
     remote._create_dir_if_not_exist("backup_images")
 
 
-def factory_reset_device(device: Literal["displaypack", "stellarunicorn", "unicornpack"], generated_backup_images: bool = True) -> None:
+def factory_reset_device(device: Literal["displaypack", "stellarunicorn", "unicornpack"], generated_backup_images: bool = True, precompile: bool = False) -> None:
     """delete all files and start from scratch
 
-    should be called when setting up devices"""
+    should be called when setting up devices
+
+    Args:
+        device: device type
+        generated_backup_images: generate and upload backup images. Defaults to True.
+        precompile: precompile the core code with mpy-cross, see `RemoteInterface.put_module`. Defaults to False.
+    """
     remote = RemoteInterface()
     remote.delete_dir_and_contents("")
-    remote.put("./src/hardware/core.py", "core.py")
+    remote.put_module("./src/hardware/core.py", "core.py", precompile)
     remote.put(f"./src/hardware/{device}.py", "main.py")
 
     print("Source code uploaded")